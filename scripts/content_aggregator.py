@@ -2,12 +2,15 @@ import os
 import sys
 import json
 import datetime
+import hashlib
 import re
 import argparse
 import logging
 import time
 import subprocess
-from typing import List, Dict, Any, Optional  # Added typing imports
+import threading
+import itertools
+from typing import List, Dict, Any, Optional, Iterator  # Added typing imports
 from urllib.parse import urlparse
 
 # Optional imports
@@ -34,11 +37,19 @@ except ImportError:
 
 try:
     from pymongo import MongoClient, UpdateOne
+    from pymongo.errors import BulkWriteError
     MONGODB_AVAILABLE = True
 except ImportError:
     MONGODB_AVAILABLE = False
     print("Warning: pymongo not installed. Content will not be stored in database.")
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    print("Warning: ijson not installed. Scraper output will be parsed after the process exits.")
+
 try:
     from dotenv import load_dotenv
     DOTENV_AVAILABLE = True
@@ -67,6 +78,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ContentAggregator")
 
+# Import the Reddit scraper in-process when its dependencies are present;
+# it calls sys.exit() on a missing dependency, so SystemExit is caught too.
+# Imported after logging is configured so our handlers stay in effect.
+reddit_scraper = None
+if REDDIT_SCRAPER_AVAILABLE:
+    try:
+        import reddit_scraper
+    except (ImportError, SystemExit):
+        logger.warning("Reddit scraper dependencies missing in this interpreter; will run it as a subprocess")
+
 # Parse command-line arguments
 parser = argparse.ArgumentParser(description='Fetch and store content from various sources')
 parser.add_argument('--sources', nargs='+', choices=['rss', 'x', 'facebook', '4chan', 'reddit', 'youtube'], 
@@ -80,6 +101,8 @@ parser.add_argument('--4chan-boards', type=str, default='g,pol,news,sci',
                     help='Comma-separated list of 4chan boards to scrape (overridden by config file if used)')
 parser.add_argument('--youtube-channels', type=str, default='',
                     help='Comma-separated list of YouTube channel IDs to scrape (overridden by config file if used)')
+parser.add_argument('--daemon', action='store_true', help='Run continuously, reusing one MongoDB connection pool')
+parser.add_argument('--interval', type=int, default=900, help='Refresh interval in seconds in daemon mode (default: 15 min)')
 args = parser.parse_args()
 
 # MongoDB setup
@@ -92,40 +115,55 @@ if DOTENV_AVAILABLE:
 if MONGODB_AVAILABLE:
     try:
         mongo_uri = os.getenv('MONGO_URI') or 'mongodb://localhost:27017/glovepost'
-        client = MongoClient(mongo_uri)
+        # Pooled, compressed connection; in --daemon mode it is reused across cycles.
+        # zstd/snappy need their optional packages; zlib is always available as a fallback.
+        client = MongoClient(mongo_uri, maxPoolSize=16, minPoolSize=4, socketTimeoutMS=5000,
+                             compressors='zstd,snappy,zlib', zlibCompressionLevel=3)
         db = client['glovepost']
         content_collection = db['contents']
         client.admin.command('ping')
         logger.info("Connected to MongoDB")
+        # Keeps the url $in prefilter in write_content_batch an index scan, and stops a URL inserted
+        # by another writer between that lookup and insert_many from becoming a second document.
+        # Partial, because the backend's updateRating inserts documents without a url.
+        try:
+            content_collection.create_index('url', unique=True, partialFilterExpression={'url': {'$type': 'string'}})
+        except Exception as e:
+            logger.warning(f"Could not create unique url index (existing duplicates or index?): {e}")
     except Exception as e:
         logger.warning(f"MongoDB connection error: {e}. Running in dry-run mode.")
         MONGODB_AVAILABLE = False
 else:
     logger.warning("MongoDB not available. Running in dry-run mode.")
 
-# Categorization function (unchanged)
-def categorize_content(text, title=""):
-    combined_text = (title + " " + text).lower()
-    categories = {
-        'Tech': ['technology', 'software', 'programming', 'ai', 'robot', 'computer', 'code', 
-                'app', 'startup', 'digital', 'cyber', 'data', 'internet'],
-        'Business': ['business', 'economy', 'market', 'stock', 'finance', 'trade', 'investment',
-                   'company', 'industry', 'economic', 'corporate', 'profit'],
-        'Sports': ['sport', 'game', 'team', 'player', 'match', 'tournament', 'championship',
-                 'football', 'soccer', 'basketball', 'baseball', 'olympic'],
-        'Entertainment': ['movie', 'music', 'celebrity', 'film', 'tv', 'television', 'show',
-                        'actor', 'actress', 'director', 'entertainment', 'star', 'media'],
-        'Health': ['health', 'medical', 'disease', 'treatment', 'doctor', 'patient',
-                 'medicine', 'drug', 'hospital', 'symptom', 'wellness', 'fitness'],
-        'Politics': ['politics', 'government', 'policy', 'election', 'president', 'minister',
-                   'law', 'vote', 'campaign', 'political', 'democrat', 'republican']
-    }
-    category_scores = {}
-    for category, keywords in categories.items():
-        score = sum(keyword in combined_text for keyword in keywords)
-        if score > 0:
-            category_scores[category] = score
-    return max(category_scores.items(), key=lambda x: x[1])[0] if category_scores else 'General'
+# Categorization keywords, flattened once at import into (keyword, category index) pairs
+CATEGORY_KEYWORDS = {
+    'Tech': ['technology', 'software', 'programming', 'ai', 'robot', 'computer', 'code', 
+            'app', 'startup', 'digital', 'cyber', 'data', 'internet'],
+    'Business': ['business', 'economy', 'market', 'stock', 'finance', 'trade', 'investment',
+               'company', 'industry', 'economic', 'corporate', 'profit'],
+    'Sports': ['sport', 'game', 'team', 'player', 'match', 'tournament', 'championship',
+             'football', 'soccer', 'basketball', 'baseball', 'olympic'],
+    'Entertainment': ['movie', 'music', 'celebrity', 'film', 'tv', 'television', 'show',
+                    'actor', 'actress', 'director', 'entertainment', 'star', 'media'],
+    'Health': ['health', 'medical', 'disease', 'treatment', 'doctor', 'patient',
+             'medicine', 'drug', 'hospital', 'symptom', 'wellness', 'fitness'],
+    'Politics': ['politics', 'government', 'policy', 'election', 'president', 'minister',
+               'law', 'vote', 'campaign', 'political', 'democrat', 'republican']
+}
+CATEGORY_NAMES = list(CATEGORY_KEYWORDS)
+KEYWORD_CATEGORY_INDEX = [(keyword, i) for i, keywords in enumerate(CATEGORY_KEYWORDS.values()) for keyword in keywords]
+
+def categorize_content(text="", title="", lowered=None):
+    """Pick the best-matching category; pass `lowered` to reuse an already lowercased title+text."""
+    combined_text = lowered if lowered is not None else (title + " " + text).lower()
+    scores = [0] * len(CATEGORY_NAMES)
+    for keyword, idx in KEYWORD_CATEGORY_INDEX:
+        if keyword in combined_text:
+            scores[idx] += 1
+    # First category wins ties, as with the previous dict-based max
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return CATEGORY_NAMES[best] if scores[best] else 'General'
 
 # Mock fetch functions (unchanged for brevity)
 def fetch_x_posts(limit=10, max_retries=3):
@@ -600,103 +638,201 @@ def fetch_youtube_videos(limit: int = 30, max_retries: int = 3) -> List[Dict[str
             logger.error(f"Unexpected error: {str(e)}")
             return []
 
-def fetch_reddit_posts(limit: int = 50, max_retries: int = 3) -> List[Dict[str, Any]]:
-    """Fetch reddit posts with retries."""
+def skip_to_json_array(stream) -> bytes:
+    """Consume lines a scraper printed ahead of its JSON array; returns the line the array starts on (b'' if none)."""
+    for line in stream:
+        if line.lstrip().startswith(b'['):
+            return line
+    return b''
+
+def run_scraper_streaming(cmd: List[str]) -> List[Dict[str, Any]]:
+    """Run a scraper subprocess and parse its JSON array output as it is produced.
+
+    stdout is consumed incrementally (with ijson when available) so the full
+    output never has to be held as one decoded string. stderr is drained on a
+    background thread to keep the child from blocking on a full pipe.
+    """
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_chunks = []
+    stderr_thread = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    stderr_thread.start()
+    
+    try:
+        # Lines printed before the array (e.g. warnings quoting "[Errno ...]") must not reach the parser
+        first_line = skip_to_json_array(process.stdout)
+        if not first_line:
+            raise ValueError("No JSON data found in output")
+        if IJSON_AVAILABLE:
+            content = []
+            items = ijson.sendable_list()
+            item_parser = ijson.items_coro(items, 'item', use_float=True)
+            for chunk in itertools.chain([first_line], iter(lambda: process.stdout.read(65536), b'')):
+                item_parser.send(chunk)
+                content.extend(items)
+                del items[:]
+            item_parser.close()
+            content.extend(items)
+        else:
+            stdout = (first_line + process.stdout.read()).decode('utf-8', errors='replace')
+            json_end = stdout.rfind(']')
+            if json_end == -1:
+                raise ValueError("No JSON data found in output")
+            content = json.loads(stdout[:json_end + 1])
+        parse_error = None
+    except Exception as e:
+        parse_error = e
+    finally:
+        process.stdout.close()
+    
+    try:
+        returncode = process.wait(timeout=5 if parse_error else None)
+    except subprocess.TimeoutExpired:
+        # Output was malformed while the scraper was still running
+        process.kill()
+        process.wait()
+        raise parse_error
+    stderr_thread.join()
+    
+    # A failed scraper takes precedence over whatever it managed to print
+    if returncode != 0:
+        stderr = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+    if parse_error:
+        raise parse_error
+    return content
+
+def fetch_reddit_posts(limit: int = 50, max_retries: int = 3) -> Iterator[Dict[str, Any]]:
+    """Fetch reddit posts with retries, yielding each post as it is normalized."""
     logger.info("Fetching Reddit posts")
     if not REDDIT_SCRAPER_AVAILABLE:
         logger.warning("Reddit scraper not found, using mock data")
-        return []  # TODO: Replace with generate_mock_reddit_posts(limit)
+        return  # TODO: Replace with generate_mock_reddit_posts(limit)
     
     scraper_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reddit_scraper.py')
     config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), args.config) if SOURCES_CONFIG_AVAILABLE else None
     subreddits = args.__dict__.get('reddit_subreddits', 'news,technology,worldnews,science')
     scraper_limit = min(limit, 50)
     
+    def standardize(content):
+        for item in content:
+            yield {
+                'title': item.get('title', 'Untitled Reddit Post'),
+                'summary': item.get('content_summary', ''),
+                'source': item.get('source', 'Reddit'),
+                'link': item.get('url', '#'),
+                'published': item.get('timestamp', datetime.datetime.now().isoformat()),
+                'author': item.get('author', 'u/anonymous'),
+                'category': item.get('category', 'Misc')
+            }
+    
+    # Call the scraper directly when it imported cleanly: no fork/exec and no JSON round-trip
+    if reddit_scraper is not None:
+        try:
+            content = reddit_scraper.fetch_reddit_content(
+                [s.strip() for s in subreddits.split(',') if s.strip()], scraper_limit)
+            logger.info(f"Fetched {len(content)} posts from Reddit")
+            yield from standardize(content)
+            return
+        except Exception as e:
+            logger.error(f"In-process Reddit scraper failed: {e}. Falling back to subprocess.")
+    
     for attempt in range(max_retries):
         try:
             # Use the virtual environment Python interpreter
             venv_python = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'venv', 'bin', 'python')
             cmd = [venv_python if os.path.exists(venv_python) else sys.executable, scraper_path, '--subreddits', subreddits, '--limit', str(scraper_limit)]
             logger.info(f"Attempt {attempt + 1}/{max_retries}: Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            # Extract the JSON part of the output by finding last occurrence of [
-            stdout = result.stdout
-            json_start = stdout.rfind('[')
-            if json_start == -1:
-                raise ValueError("No JSON data found in output")
-                
-            # Find the matching closing bracket
-            json_data = stdout[json_start:]
-            
-            # Simple JSON extraction that handles nested arrays
-            bracket_count = 0
-            for i, char in enumerate(json_data):
-                if char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        # Found the matching closing bracket
-                        json_data = json_data[:i+1]
-                        break
-            
-            try:
-                content = json.loads(json_data)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON: {e}, Data: {json_data[:100]}...")
-                raise
+            content = run_scraper_streaming(cmd)
                 
             logger.info(f"Fetched {len(content)} posts from Reddit")
-            return [{
-                'title': item.get('title', 'Untitled Reddit Post'),
-                'summary': item.get('content_summary', ''),
-                'source': item.get('source', 'Reddit'),
-                'link': item.get('url', '#'),
-                'published': item.get('timestamp', datetime.datetime.now().isoformat()),
-                'author': item.get('author', 'u/anonymous'),
-                'category': item.get('category', 'Misc')
-            } for item in content]
+            yield from standardize(content)
+            return
         except subprocess.CalledProcessError as e:
             logger.error(f"Attempt {attempt + 1} failed with exit code {e.returncode}")
             logger.error(f"STDERR: {e.stderr}")
-            logger.error(f"STDOUT: {e.stdout}")
             if attempt < max_retries - 1:
                 time.sleep(2 ** attempt)  # Exponential backoff
             else:
-                logger.warning("Max retries reached. Returning empty list.")
-                return []
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse output: {e}. Raw: {result.stdout}")
-            return []
+                logger.warning("Max retries reached. Returning no posts.")
+                return
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            return []
+            logger.error(f"Failed to parse Reddit scraper output: {str(e)}")
+            return
+
+def content_hash(text):
+    """SHA-256 of lowercased, whitespace-normalized text; matches content_filter_fixed.content_hash."""
+    return hashlib.sha256(' '.join(text.lower().split()).encode('utf-8')).hexdigest()
 
-# Clean content (unchanged)
-def clean_content(item):
+# Clean content
+def clean_content(item, run_ts=None):
+    """Normalize a fetched item; run_ts is the shared fetch timestamp for the whole run."""
     if 'summary' not in item or len(item.get('summary', '')) < 50:
         return None
-    category = item.get('category') or categorize_content(item.get('summary', ''), item.get('title', ''))
-    timestamp = item.get('published', datetime.datetime.now().isoformat())
-    summary = item.get('summary', '')[:1000] + ('...' if len(item.get('summary', '')) > 1000 else '')
+    if run_ts is None:
+        run_ts = datetime.datetime.now().isoformat()
+    raw_summary = item['summary']
+    category = item.get('category')
+    if not category:
+        category = categorize_content(lowered=f"{item.get('title', '')} {raw_summary}".lower())
+    timestamp = item.get('published', run_ts)
+    summary = raw_summary[:1000] + ('...' if len(raw_summary) > 1000 else '')
     
     content_object = {
         'title': item.get('title', 'Untitled'),
         'source': item.get('source', 'Unknown'),
         'url': item.get('link', '#'),
         'content_summary': summary,
+        'content_hash': content_hash(summary),
         'timestamp': timestamp,
         'category': category,
         'author': item.get('author', ''),
-        'fetched_at': datetime.datetime.now().isoformat()
+        'fetched_at': run_ts
     }
     return content_object
 
+def write_content_batch(items: List[Dict[str, Any]]) -> int:
+    """Write cleaned items, inserting new URLs and updating existing ones.
+
+    A single $in query finds which URLs are already stored, so new items go
+    through one insert_many and only the rest need per-document updates.
+    """
+    # Later items win on duplicate URLs, matching the previous upsert behaviour
+    batch = {item['url']: item for item in items}
+    urls = list(batch)
+    existing_urls = {
+        doc['url'] for doc in
+        content_collection.find({'url': {'$in': urls}}, projection={'url': 1, '_id': 0}).batch_size(1000)
+    }
+    
+    stored = 0
+    new_items = [item for url, item in batch.items() if url not in existing_urls]
+    update_urls = [url for url in batch if url in existing_urls]
+    if new_items:
+        try:
+            # insert_many adds _id to the dicts it is given, so pass copies
+            result = content_collection.insert_many([dict(item) for item in new_items], ordered=False)
+            stored += len(result.inserted_ids)
+        except BulkWriteError as e:
+            stored += e.details.get('nInserted', 0)
+            # URLs another writer stored after the lookup hit the unique index; update them instead
+            for error in e.details.get('writeErrors', []):
+                if error.get('code') == 11000:
+                    update_urls.append(new_items[error['index']]['url'])
+                else:
+                    logger.error(f"Insert failed for {new_items[error['index']]['url']}: {error.get('errmsg')}")
+    
+    updates = [UpdateOne({'url': url}, {'$set': batch[url]}) for url in update_urls]
+    if updates:
+        result = content_collection.bulk_write(updates, ordered=False)
+        stored += result.modified_count
+    
+    logger.info(f"Bulk write: {len(batch) - len(updates)} new, {len(updates)} existing URLs, {stored} items stored")
+    return stored
+
 # Store content (updated with parallel execution)
 def store_content(dry_run=False):
     """Store content with batch writes and parallel fetching."""
-    from concurrent.futures import ThreadPoolExecutor
-    import threading
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     
     sources = {
         'x': fetch_x_posts if ('x' in args.sources and REQUESTS_AVAILABLE) else None,
@@ -710,12 +846,20 @@ def store_content(dry_run=False):
     # Filter out None values
     active_sources = {k: v for k, v in sources.items() if v is not None}
     
+    # One timestamp for the whole run instead of one per item
+    run_ts = datetime.datetime.now().isoformat()
+    
     total_items = 0
     stored_items = 0
     all_content = []
-    # Use a lock for thread-safe operations on shared resources
-    content_lock = threading.Lock()
-    items_lock = threading.Lock()
+    write_to_db = MONGODB_AVAILABLE and not (dry_run or args.dryrun)
+    
+    def write_chunk(items):
+        try:
+            return write_content_batch(items)
+        except Exception as e:
+            logger.error(f"Error during bulk write: {e}")
+            return len(items)  # Fallback count
     
     if not active_sources:
         logger.warning("No sources configured. Using mock data.")
@@ -725,77 +869,75 @@ def store_content(dry_run=False):
                 'source': f'Mock Source {i % 3 + 1}',
                 'url': f'https://example.com/article{i}',
                 'content_summary': f'This is mock content {i} for testing purposes.',
-                'timestamp': datetime.datetime.now().isoformat(),
+                'timestamp': run_ts,
                 'category': ['Tech', 'Business', 'Sports', 'Entertainment', 'Health'][i % 5],
                 'author': f'Mock Author {i % 3 + 1}',
-                'fetched_at': datetime.datetime.now().isoformat()
+                'fetched_at': run_ts
             }
             for i in range(10)
         ]
         total_items = 10
+        if write_to_db:
+            stored_items = write_chunk(all_content)
     else:
-        # Define a worker function to fetch and process content from a single source
+        # Define a worker function to fetch and process content from a single source.
+        # Each worker returns its own results, which are merged on the main thread,
+        # so no shared state (and no locks) is needed.
         def fetch_and_process_source(source_name, fetch_func):
-            nonlocal total_items
             source_start_time = time.time()
             try:
                 logger.info(f"Fetching from {source_name}...")
-                source_content = fetch_func(args.limit)
                 source_items = []
+                source_count = 0
                 
-                # Clean items locally first for better performance
-                for item in source_content:
-                    cleaned = clean_content(item)
+                # Clean items as they are fetched; some fetchers are generators, so
+                # this single pass is also what counts them
+                for item in fetch_func(args.limit):
+                    source_count += 1
+                    cleaned = clean_content(item, run_ts)
                     if cleaned:
                         source_items.append(cleaned)
-                
-                # Update shared resources with a lock
-                with items_lock:
-                    total_items += len(source_content)
-                
-                with content_lock:
-                    all_content.extend(source_items)
                     
                 duration = time.time() - source_start_time
-                logger.info(f"Completed {source_name} fetch in {duration:.2f} seconds: {len(source_items)} valid items from {len(source_content)} total")
+                logger.info(f"Completed {source_name} fetch in {duration:.2f} seconds: {len(source_items)} valid items from {source_count} total")
+                return source_count, source_items
                 
             except Exception as e:
                 logger.error(f"Error processing {source_name}: {e}")
                 import traceback
                 logger.error(traceback.format_exc())
+                return 0, []
         
-        # Use ThreadPoolExecutor to run fetching in parallel
-        with ThreadPoolExecutor(max_workers=min(len(active_sources), 5)) as executor:
-            # Start one thread per source
-            futures = {}
-            for source_name, fetch_func in active_sources.items():
-                future = executor.submit(fetch_and_process_source, source_name, fetch_func)
-                futures[future] = source_name
-            
-            # Wait for all to complete (or fail)
-            for future in futures:
-                try:
-                    future.result()  # This will re-raise any exceptions from the thread
-                except Exception as e:
-                    source_name = futures[future]
-                    logger.error(f"Unhandled exception in {source_name} thread: {e}")
-                    
-        logger.info(f"All source fetching complete. Total items: {total_items}, valid items: {len(all_content)}")
+        # Each source's items are handed to a writer thread as soon as the source
+        # completes, so DB writes overlap the sources that are still fetching.
+        # A single writer keeps the URL prefilter in write_content_batch race-free.
+        write_futures = []
+        with ThreadPoolExecutor(max_workers=1) as write_executor:
+            # Use ThreadPoolExecutor to run fetching in parallel
+            with ThreadPoolExecutor(max_workers=min(len(active_sources), 5)) as executor:
+                # Start one thread per source
+                futures = {}
+                for source_name, fetch_func in active_sources.items():
+                    future = executor.submit(fetch_and_process_source, source_name, fetch_func)
+                    futures[future] = source_name
+                
+                # Merge results as each source completes (or fails)
+                for future in as_completed(futures):
+                    try:
+                        source_count, source_items = future.result()  # This will re-raise any exceptions from the thread
+                        total_items += source_count
+                        all_content.extend(source_items)
+                        if write_to_db and source_items:
+                            write_futures.append(write_executor.submit(write_chunk, source_items))
+                    except Exception as e:
+                        source_name = futures[future]
+                        logger.error(f"Unhandled exception in {source_name} thread: {e}")
+                        
+            logger.info(f"All source fetching complete. Total items: {total_items}, valid items: {len(all_content)}")
+        
+        stored_items = sum(write_future.result() for write_future in write_futures)
     
-    if MONGODB_AVAILABLE and not (dry_run or args.dryrun):
-        operations = [
-            UpdateOne({'url': item['url']}, {'$set': item}, upsert=True)
-            for item in all_content
-        ]
-        if operations:
-            try:
-                result = content_collection.bulk_write(operations)
-                stored_items = result.upserted_count + result.modified_count
-                logger.info(f"Bulk write: {stored_items} items stored")
-            except Exception as e:
-                logger.error(f"Error during bulk write: {e}")
-                stored_items = len(all_content)  # Fallback count
-    else:
+    if not write_to_db:
         stored_items = len(all_content)
         if all_content:
             logger.info(f"Sample content item: {json.dumps(all_content[0], indent=2)}")
@@ -803,9 +945,27 @@ def store_content(dry_run=False):
     logger.info(f"Processed {total_items} items, prepared {stored_items} for database")
     return stored_items
 
+def run_daemon(interval):
+    """Run store cycles every `interval` seconds, keeping the MongoDB client alive between them."""
+    logger.info(f"Running in daemon mode with interval of {interval} seconds")
+    while True:
+        cycle_start = time.time()
+        try:
+            store_content(args.dryrun)
+        except Exception as e:
+            logger.error(f"Content refresh cycle failed: {e}")
+        sleep_time = max(0, interval - (time.time() - cycle_start))
+        logger.info(f"Next refresh cycle in {sleep_time:.0f} seconds")
+        time.sleep(sleep_time)
+
 if __name__ == '__main__':
     try:
-        store_content(args.dryrun)
+        if args.daemon:
+            run_daemon(args.interval)
+        else:
+            store_content(args.dryrun)
+    except KeyboardInterrupt:
+        logger.info("Interrupted by user")
     except Exception as e:
         logger.error(f"Unhandled exception: {e}")
         sys.exit(1)
\ No newline at end of file
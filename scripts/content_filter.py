@@ -10,11 +10,12 @@ This script:
 5. Updates the database with filtered content
 
 Usage:
-    python content_filter.py [--debug] [--limit=N]
+    python content_filter.py [--debug] [--limit=N] [--workers=N]
 
 Options:
     --debug       Enable debug mode with additional logging
     --limit=N     Process only N items (default: all)
+    --workers=N   Worker processes for cleaning and scoring (default: CPU count)
 """
 
 import os
@@ -25,22 +26,71 @@ import logging
 import argparse
 import datetime
 import html
+import hashlib
+import multiprocessing
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple
 from urllib.parse import urlparse
 import difflib
 import unicodedata
 
 try:
-    from pymongo import MongoClient
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    from pymongo import MongoClient, UpdateOne
+    from pymongo.errors import BulkWriteError
+    from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
+    from sklearn.preprocessing import normalize
     from sklearn.metrics.pairwise import cosine_similarity
+    from scipy.sparse import vstack
+    import numpy as np
     import nltk
-    from nltk.tokenize import sent_tokenize, word_tokenize
+    from nltk.tokenize import sent_tokenize
 except ImportError as e:
     print(f"Error: Required dependency not found: {e}")
-    print("Please install required dependencies: pip install pymongo scikit-learn nltk")
+    print("Please install required dependencies: pip install pymongo scikit-learn scipy numpy nltk")
     sys.exit(1)
 
+try:
+    from rapidfuzz import fuzz, process as rapidfuzz_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    print("Warning: rapidfuzz not installed, using difflib for title similarity. Install with: pip install rapidfuzz")
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    print("Warning: datasketch not installed, title checks will scan every item. Install with: pip install datasketch")
+    DATASKETCH_AVAILABLE = False
+
+try:
+    from simhash import Simhash, SimhashIndex
+    SIMHASH_AVAILABLE = True
+except ImportError:
+    print("Warning: simhash not installed, skipping near-identical content fast path. Install with: pip install simhash")
+    SIMHASH_AVAILABLE = False
+
+try:
+    import regex
+    REGEX_AVAILABLE = True
+except ImportError:
+    print("Warning: regex not installed, HTML patterns will backtrack on unclosed tags. Install with: pip install regex")
+    REGEX_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    print("Warning: hyperscan not installed, using regex/Aho-Corasick phrase matching. Install with: pip install hyperscan")
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    print("Warning: pyahocorasick not installed, using a regex for quality phrases. Install with: pip install pyahocorasick")
+    AHOCORASICK_AVAILABLE = False
+
 # Try to download NLTK data if needed
 try:
     nltk.data.find('tokenizers/punkt')
@@ -48,6 +98,13 @@ except LookupError:
     print("Downloading required NLTK data...")
     nltk.download('punkt', quiet=True)
 
+# Load the English Punkt model once instead of going through sent_tokenize's lookup per call
+try:
+    split_sentences = nltk.data.load('tokenizers/punkt/english.pickle').tokenize
+except Exception:
+    # Newer NLTK releases no longer load pickled models; sent_tokenize caches its own tokenizer
+    split_sentences = sent_tokenize
+
 # Configure logging
 logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
 os.makedirs(logs_dir, exist_ok=True)
@@ -67,10 +124,32 @@ MONGO_PORT = 27017
 MONGO_DB = 'glovepost'
 MONGO_COLLECTION = 'content'
 
+# Fields of existing items read by duplicate detection (_id is always included)
+EXISTING_ITEM_FIELDS = {"url": 1, "title": 1, "content_summary": 1}
+
 # Content filtering thresholds
 MIN_CONTENT_LENGTH = 100  # Minimum characters for content to be valid
 MIN_TITLE_LENGTH = 5      # Minimum characters for title to be valid
 MAX_DUPLICATE_SCORE = 0.85  # Maximum cosine similarity score to consider as duplicate
+TITLE_SIMILARITY_THRESHOLD = 0.9  # Title similarity ratio above which items are duplicates
+TITLE_LSH_THRESHOLD = 0.5  # Shingle Jaccard for LSH title candidates (kept low so near-duplicates are not missed)
+TITLE_SHINGLE_SIZE = 5     # Character n-gram size used for title MinHashes
+MINHASH_PERMUTATIONS = 128
+CONTENT_HASH_FEATURES = 2 ** 18  # Hashed feature space for content similarity vectors
+CONTENT_LSH_THRESHOLD = 0.5  # Word-set Jaccard for LSH content candidates (below MAX_DUPLICATE_SCORE to keep recall)
+SIMHASH_MAX_DISTANCE = 3  # Max Hamming distance (of 64 bits) for near-identical content candidates
+SIMHASH_SHINGLE_SIZE = 3  # Words per shingle in content SimHash fingerprints
+TITLE_BLOCK_JACCARD = 0.3  # Min word-prefix overlap before a title pair gets a full ratio without rapidfuzz
+WRITE_BATCH_SIZE = 500  # Queued item updates per bulk write
+CURSOR_BATCH_SIZE = 200  # Unfiltered items fetched per cursor round trip
+CLEAN_CACHE_SIZE = 4096  # Distinct contents whose cleaning result is memoized
+WORKER_CHUNK_SIZE = 32  # Items handed to a worker process at a time
+TEXT_SEARCH_CANDIDATES = 20  # Title candidates fetched from the text index when LSH is unavailable
+
+# Title MinHashes by item _id, so an item is only hashed once per run
+_title_minhash_cache = {}
+# Quality verdicts by URL domain: (score_delta, quality_factors)
+_domain_verdict_cache = {}
 QUALITY_THRESHOLD = 0.5   # Quality score threshold (0-1)
 
 # Enhanced noise phrase lists (merged from fixed version)
@@ -99,6 +178,15 @@ FLUFF_PHRASES = [
     "according to research", "sources say", "many people are saying"
 ]
 
+# Sources (matched as substrings of the source name or domain) that earn a small bonus
+REPUTABLE_SOURCES = ('cnn', 'bbc', 'reuters', 'ap', 'associated press',
+                     'nytimes', 'new york times', 'washingtonpost', 'washington post',
+                     'economist', 'nature', 'science', 'national geographic',
+                     'guardian', 'npr', 'pbs', 'aljazeera', 'theverge')
+
+# Domain endings that lower the quality score
+SUSPICIOUS_TLDS = ('.xyz', '.info', '.biz', '.click', '.club', '.top')
+
 # Noise phrases to remove
 NOISE_PHRASES = [
     "please enable javascript",
@@ -211,11 +299,168 @@ HTML_ENTITIES = {
     '&rdquo;': '"',
 }
 
+# Precompiled patterns for clean_content
+# The HTML patterns spell out "anything up to the closing tag" as [^<]* runs separated by
+# '<' not starting the close tag, instead of a lazy .*?. With the regex module the runs are
+# possessive (_P), so a failed match is given up without backtracking through them.
+_html_re = regex if REGEX_AVAILABLE else re
+_P = '+' if REGEX_AVAILABLE else ''
+# script/style/iframe/noscript blocks with their content, in one pass
+_RE_SCRIPT_STYLE = _html_re.compile(
+    rf'<(script|style|iframe|noscript)[^>]*{_P}>[^<]*{_P}(?:<(?!/\1>)[^<]*{_P})*{_P}</\1>', re.IGNORECASE)
+_RE_PARA = _html_re.compile(rf'<p[^>]*{_P}>([^<]*{_P}(?:<(?!/p>)[^<]*{_P})*{_P})</p>', re.IGNORECASE)
+_RE_ANCHOR = _html_re.compile(rf'<a[^>]*{_P}>([^<]*{_P}(?:<(?!/a>)[^<]*{_P})*{_P})</a>')
+_RE_NUM_ENT = re.compile(r'&#(\d+);')
+_RE_HEX_ENT = re.compile(r'&#x([0-9a-fA-F]+);')
+_RE_TAG = _html_re.compile(rf'<[^>]+{_P}>')
+_RE_MULTINL = re.compile(r'\n{2,}')
+_RE_HSPACE = re.compile(r'[^\S\n]+')
+_RE_SOURCE_LINK = re.compile(r'Source\s*:?\s*https?://\S+', re.IGNORECASE)
+_RE_TRAILING_SOURCE = re.compile(r'Source\s*:?\s*$', re.IGNORECASE)
+_RE_AGO = re.compile(r'\b\d+\s+(?:second|minute|hour|day|week|month|year)s?\s+ago\b', re.IGNORECASE)
+_RE_WS = re.compile(r'\s+')
+_RE_WORD = re.compile(r'\w+')
+_RE_URL = re.compile(r'https?://\S+')
+_RE_EMAIL = re.compile(r'\S+@\S+\.\S+')
+_RE_ENTITY_ANY = re.compile(r'&[#a-zA-Z0-9]+;')
+_RE_NAMED_ENT = re.compile(r'&([a-zA-Z0-9]+);')
+# All noise phrases in one alternation; longest first so e.g. "view all comments" wins over "comments"
+_RE_NOISE = re.compile('|'.join(re.escape(phrase) for phrase in sorted(NOISE_PHRASES, key=len, reverse=True)),
+                       re.IGNORECASE)
+
+# Leftover HTML_ENTITIES in one pass. Entities listed after '&amp;' are also matched behind a
+# literal '&amp;', since replacing them one by one in dict order decoded those too.
+_entities_after_amp = list(HTML_ENTITIES)[list(HTML_ENTITIES).index('&amp;') + 1:]
+_RE_HTML_ENTITIES = re.compile(
+    '&amp;(?:' + '|'.join(re.escape(entity[1:]) for entity in _entities_after_amp) + ')|' +
+    '|'.join(re.escape(entity) for entity in HTML_ENTITIES))
+
+def _html_entity(match) -> str:
+    entity = match.group(0)
+    if entity in HTML_ENTITIES:
+        return HTML_ENTITIES[entity]
+    return HTML_ENTITIES['&' + entity[len('&amp;'):]]
+
+# Elements removed together with their content
+BLOCK_TAGS = ('script', 'style', 'iframe', 'noscript')
+
+# Quality phrase categories, matched in a single pass over the text
+QUALITY_PHRASE_CATEGORIES = {}
+for _category, _phrases in (('ad', AD_PHRASES), ('clickbait', CLICKBAIT_PHRASES), ('fluff', FLUFF_PHRASES)):
+    for _phrase in _phrases:
+        QUALITY_PHRASE_CATEGORIES.setdefault(_phrase, set()).add(_category)
+
+def compile_phrase_database(phrases: List[str], caseless: bool = False):
+    """
+    Compile literal phrases into one Hyperscan database; match ids are list positions.
+    
+    Args:
+        phrases: Phrases to match
+        caseless: Match ASCII letters case-insensitively
+        
+    Returns:
+        hyperscan.Database reporting leftmost start offsets
+    """
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST | (hyperscan.HS_FLAG_CASELESS if caseless else 0)
+    database = hyperscan.Database()
+    database.compile(expressions=[re.escape(phrase).encode('utf-8') for phrase in phrases],
+                     ids=list(range(len(phrases))), elements=len(phrases), flags=[flags] * len(phrases))
+    return database
+
+def scan_phrases(database, data: bytes) -> List[Tuple[int, int, int]]:
+    """
+    Scan bytes with a Hyperscan phrase database in one pass.
+    
+    Args:
+        database: Database created by compile_phrase_database
+        data: UTF-8 encoded text
+        
+    Returns:
+        Every (phrase_id, start, end) byte-offset match, overlapping matches included
+    """
+    matches = []
+    
+    def on_match(phrase_id, start, end, flags, context):
+        matches.append((phrase_id, start, end))
+    
+    database.scan(data, match_event_handler=on_match)
+    return matches
+
+if HYPERSCAN_AVAILABLE:
+    _noise_phrase_list = list(NOISE_PHRASES)
+    _noise_database = compile_phrase_database(_noise_phrase_list, caseless=True)
+    _quality_phrase_list = list(QUALITY_PHRASE_CATEGORIES)
+    _quality_database = compile_phrase_database(_quality_phrase_list)
+elif AHOCORASICK_AVAILABLE:
+    _quality_automaton = ahocorasick.Automaton()
+    for _phrase in QUALITY_PHRASE_CATEGORIES:
+        _quality_automaton.add_word(_phrase, _phrase)
+    _quality_automaton.make_automaton()
+else:
+    # Lookahead alternation reports a match at every position; a phrase hidden behind a longer
+    # one starting at the same position is recovered through _quality_subphrases
+    _RE_QUALITY_PHRASES = re.compile('(?=(' + '|'.join(
+        re.escape(phrase) for phrase in sorted(QUALITY_PHRASE_CATEGORIES, key=len, reverse=True)) + '))')
+    _quality_subphrases = {
+        phrase: [other for other in QUALITY_PHRASE_CATEGORIES if other != phrase and other in phrase]
+        for phrase in QUALITY_PHRASE_CATEGORIES
+    }
+
+def _strip_blocks(text: str, open_tag: str, close_tag: str, ignore_case: bool = True,
+                  unclosed_to_end: bool = False) -> str:
+    """
+    Remove open_tag...close_tag blocks using str.find instead of a DOTALL regex.
+    
+    Equivalent to re.sub(open_tag + r'[^>]*>.*?' + close_tag, '', text), but linear even
+    when closing tags are missing.
+    
+    Args:
+        text: Text to strip
+        open_tag: Start of the opening tag, e.g. '<script'
+        close_tag: Closing tag, e.g. '</script>'
+        ignore_case: Match tags case-insensitively (text must keep its length when lowercased)
+        unclosed_to_end: Stop each block before its closing tag (which is kept) and remove
+            blocks that are never closed up to the end of the text
+        
+    Returns:
+        Text with the blocks removed
+    """
+    search_text = text.lower() if ignore_case else text
+    pieces = []
+    pos = 0
+    while True:
+        start = search_text.find(open_tag, pos)
+        if start == -1:
+            break
+        tag_end = search_text.find('>', start + len(open_tag))
+        if tag_end == -1:
+            break
+        close = search_text.find(close_tag, tag_end + 1)
+        pieces.append(text[pos:start])
+        if close == -1:
+            if unclosed_to_end:
+                pos = len(text)
+            else:
+                # Nothing after this point can close either; keep the rest as-is
+                pos = start
+            break
+        pos = close if unclosed_to_end else close + len(close_tag)
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+def _num_entity(match):
+    return chr(int(match.group(1)))
+
+def _hex_entity(match):
+    return chr(int(match.group(1), 16))
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Filter and clean content from MongoDB.')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--limit', type=int, default=0, help='Limit processing to N items')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for cleaning and quality scoring (default: CPU count)')
     return parser.parse_args()
 
 def connect_to_mongodb():
@@ -224,12 +469,42 @@ def connect_to_mongodb():
         client = MongoClient(MONGO_HOST, MONGO_PORT)
         db = client[MONGO_DB]
         collection = db[MONGO_COLLECTION]
+        # Serves the newest-filtered-items query used to load duplicate detection state
+        collection.create_index([("filtered", 1), ("timestamp", -1)])
         logger.info(f"Connected to MongoDB: {MONGO_HOST}:{MONGO_PORT}, DB: {MONGO_DB}")
         return collection
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {e}")
         sys.exit(1)
 
+def remove_noise_phrases(content: str) -> str:
+    """
+    Remove NOISE_PHRASES case-insensitively, preferring the longest phrase at each position.
+    
+    Args:
+        content: The content to clean
+        
+    Returns:
+        Content with the noise phrases spliced out
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return _RE_NOISE.sub('', content)
+    
+    data = content.encode('utf-8')
+    # Same selection as the regex alternation: leftmost match first, longest at equal starts, no overlaps
+    spans = sorted(((start, end) for _, start, end in scan_phrases(_noise_database, data)),
+                   key=lambda span: (span[0], -span[1]))
+    if not spans:
+        return content
+    pieces = []
+    position = 0
+    for start, end in spans:
+        if start >= position:
+            pieces.append(data[position:start])
+            position = end
+    pieces.append(data[position:])
+    return b''.join(pieces).decode('utf-8')
+
 def clean_content(content: str) -> Tuple[str, List[str]]:
     """
     Clean content by removing HTML tags, ads, and other noise.
@@ -243,6 +518,12 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     if not content or not isinstance(content, str):
         return "", ["Empty or invalid content"]
     
+    cleaned_content, modifications = _clean_content_cached(content)
+    return cleaned_content, list(modifications)
+
+@lru_cache(maxsize=CLEAN_CACHE_SIZE)
+def _clean_content_cached(content: str) -> Tuple[str, Tuple[str, ...]]:
+    """Body of clean_content, memoized so repeated texts (syndicated copies, reruns) are cleaned once."""
     original_content = content
     modifications = []
     
@@ -260,42 +541,44 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
             # More aggressive HTML removal
             # First, remove entire article tags and their contents if they appear to be broken/incomplete
             if content.count('<article') > content.count('</article>'):
-                content = re.sub(r'<article[^>]*>.*?(?=<\/article>|$)', '', content, flags=re.DOTALL)
+                content = _strip_blocks(content, '<article', '</article>', ignore_case=False, unclosed_to_end=True)
             
             # Remove certain problematic elements completely (including their content)
-            for tag in ['script', 'style', 'iframe', 'noscript']:
-                content = re.sub(rf'<{tag}[^>]*>.*?<\/{tag}>', '', content, flags=re.DOTALL|re.IGNORECASE)
+            if len(content.lower()) == len(content):
+                for tag in BLOCK_TAGS:
+                    content = _strip_blocks(content, f'<{tag}', f'</{tag}>')
+            else:
+                # Lowercasing changed the length, so find offsets would not line up
+                content = _RE_SCRIPT_STYLE.sub('', content)
             
             # Handle paragraph tags to preserve paragraph structure
-            content = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', content, flags=re.DOTALL|re.IGNORECASE)
+            content = _RE_PARA.sub(r'\1\n\n', content)
             
             # Remove anchor tags but keep their text content
-            content = re.sub(r'<a[^>]*>(.*?)</a>', r'\1', content, flags=re.DOTALL)
+            content = _RE_ANCHOR.sub(r'\1', content)
             
             # Unescape HTML entities
             content = html.unescape(content)
             
             # Handle numeric HTML entities that might not have been properly unescaped
-            content = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), content)
-            content = re.sub(r'&#x([0-9a-fA-F]+);', lambda m: chr(int(m.group(1), 16)), content)
+            content = _RE_NUM_ENT.sub(_num_entity, content)
+            content = _RE_HEX_ENT.sub(_hex_entity, content)
             
             # Remove all remaining HTML tags
-            content = re.sub(r'<[^>]+>', ' ', content)
+            content = _RE_TAG.sub(' ', content)
             
             # Normalize paragraph spacing (convert multiple newlines to exactly two)
-            content = re.sub(r'\n{2,}', '\n\n', content)
+            content = _RE_MULTINL.sub('\n\n', content)
             
             # Replace multiple spaces and tabs with a single space (but preserve paragraph breaks)
-            content = re.sub(r'[^\S\n]+', ' ', content)
+            content = _RE_HSPACE.sub(' ', content)
             
             # Handle common HTML entities manually in case they weren't unescaped
-            for entity, replacement in HTML_ENTITIES.items():
-                if entity in content:
-                    content = content.replace(entity, replacement)
+            content = _RE_HTML_ENTITIES.sub(_html_entity, content)
                     
             # Remove source link if it exists
-            content = re.sub(r'Source\s*:?\s*https?://\S+', '', content, flags=re.IGNORECASE)
-            content = re.sub(r'Source\s*:?\s*$', '', content, flags=re.IGNORECASE)
+            content = _RE_SOURCE_LINK.sub('', content)
+            content = _RE_TRAILING_SOURCE.sub('', content)
             
             if len(content) != original_length:
                 modifications.append("Removed HTML formatting")
@@ -306,12 +589,10 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     # Remove noise phrases
     original_length = len(content)
     try:
-        for phrase in NOISE_PHRASES:
-            if phrase.lower() in content.lower():
-                content = re.sub(re.escape(phrase), '', content, flags=re.IGNORECASE)
+        content = remove_noise_phrases(content)
         
         # Remove phrases like "X minutes ago", "X hours ago", etc.
-        content = re.sub(r'\b\d+\s+(?:second|minute|hour|day|week|month|year)s?\s+ago\b', '', content, flags=re.IGNORECASE)
+        content = _RE_AGO.sub('', content)
         
         if len(content) != original_length:
             modifications.append("Removed noise phrases")
@@ -322,7 +603,7 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     # Remove excessive whitespace
     original_length = len(content)
     try:
-        content = re.sub(r'\s+', ' ', content).strip()
+        content = _RE_WS.sub(' ', content).strip()
         if len(content) != original_length:
             modifications.append("Removed excessive whitespace")
     except re.error as e:
@@ -332,7 +613,8 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     # Remove URLs
     original_length = len(content)
     try:
-        content = re.sub(r'https?://\S+', '', content)
+        if 'http' in content:
+            content = _RE_URL.sub('', content)
         if len(content) != original_length:
             modifications.append("Removed URLs")
     except re.error as e:
@@ -342,7 +624,8 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     # Remove email addresses
     original_length = len(content)
     try:
-        content = re.sub(r'\S+@\S+\.\S+', '', content)
+        if '@' in content:
+            content = _RE_EMAIL.sub('', content)
         if len(content) != original_length:
             modifications.append("Removed email addresses")
     except re.error as e:
@@ -351,30 +634,337 @@ def clean_content(content: str) -> Tuple[str, List[str]]:
     
     # Final check for any remaining HTML entities
     try:
-        if re.search(r'&[#a-zA-Z0-9]+;', content):
+        if '&' in content and _RE_ENTITY_ANY.search(content):
             original_length = len(content)
             # One more pass at HTML entity decoding
             content = html.unescape(content)
             # Handle any remaining numeric entities
-            content = re.sub(r'&#(\d+);', lambda m: chr(int(m.group(1))), content)
-            content = re.sub(r'&#x([0-9a-fA-F]+);', lambda m: chr(int(m.group(1), 16)), content)
+            content = _RE_NUM_ENT.sub(_num_entity, content)
+            content = _RE_HEX_ENT.sub(_hex_entity, content)
             # Replace unknown entities with appropriate characters
-            content = re.sub(r'&([a-zA-Z0-9]+);', lambda m: ' ', content)
+            content = _RE_NAMED_ENT.sub(' ', content)
             if len(content) != original_length:
                 modifications.append("Removed additional HTML entities")
     except (re.error, ValueError) as e:
         logger.warning(f"Error while removing additional HTML entities: {e}")
         modifications.append("Failed to process some HTML entities due to error")
     
-    return content, modifications
+    return content, tuple(modifications)
+
+def similarity_score(text1: str, text2: str, threshold: float = 0.0) -> float:
+    """
+    Calculate the similarity ratio between two strings.
+    
+    Uses rapidfuzz's C++ Indel ratio when available, which computes the same
+    2*matches/total_length metric as difflib.SequenceMatcher.ratio().
+    
+    Args:
+        text1: First string
+        text2: Second string
+        threshold: Callers only care about ratios above this; pairs whose
+            length bound 2*min_len/total_len cannot exceed it return 0.0
+            without running the full comparison
+        
+    Returns:
+        Similarity ratio between 0 and 1
+    """
+    if not text1 or not text2:
+        return 0.0
+    if text1 == text2:
+        return 1.0
+    len1, len2 = len(text1), len(text2)
+    if 2 * min(len1, len2) / (len1 + len2) <= threshold:
+        return 0.0
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(text1, text2) / 100.0
+    return difflib.SequenceMatcher(None, text1, text2).ratio()
+
+def title_minhash(title: str, item_id=None):
+    """
+    Build a MinHash over the character shingles of a lowercased title.
+    
+    Args:
+        title: Lowercased title
+        item_id: Optional item _id used to cache the signature
+        
+    Returns:
+        datasketch MinHash for the title
+    """
+    if item_id is not None and item_id in _title_minhash_cache:
+        return _title_minhash_cache[item_id]
+    
+    minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+    if len(title) <= TITLE_SHINGLE_SIZE:
+        shingles = {title}
+    else:
+        shingles = {title[i:i + TITLE_SHINGLE_SIZE] for i in range(len(title) - TITLE_SHINGLE_SIZE + 1)}
+    for shingle in shingles:
+        minhash.update(shingle.encode('utf-8'))
+    
+    if item_id is not None:
+        _title_minhash_cache[item_id] = minhash
+    return minhash
+
+def add_to_title_index(title_index, item: Dict[str, Any], position: int) -> None:
+    """
+    Add an item's title to the LSH index under its position in existing_items.
+    
+    Args:
+        title_index: MinHashLSH index, or None when datasketch is unavailable
+        item: The item to index
+        position: Index of the item in the existing_items list
+    """
+    title = item.get('title', '').strip().lower()
+    if title_index is not None and title:
+        title_index.insert(position, title_minhash(title, item.get('_id')))
+
+def build_title_index(items: List[Dict[str, Any]]):
+    """
+    Build a MinHash LSH index over item titles for near-duplicate candidate lookup.
+    
+    Args:
+        items: List of existing items
+        
+    Returns:
+        MinHashLSH keyed by list position, or None when datasketch is unavailable
+    """
+    if not DATASKETCH_AVAILABLE:
+        return None
+    
+    title_index = MinHashLSH(threshold=TITLE_LSH_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+    for position, item in enumerate(items):
+        add_to_title_index(title_index, item, position)
+    return title_index
+
+def ensure_text_index(collection) -> bool:
+    """
+    Create the title/content text index used for title candidate lookup.
+    
+    Args:
+        collection: MongoDB collection
+        
+    Returns:
+        True if the index exists or was created
+    """
+    try:
+        collection.create_index([('title', 'text'), ('content_summary', 'text')], name='title_content_text')
+        return True
+    except Exception as e:
+        logger.warning(f"Could not create text index, title checks will scan every item: {e}")
+        return False
 
-def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]]) -> Tuple[bool, str, float]:
+def find_title_candidates(collection, item: Dict[str, Any], limit: int = TEXT_SEARCH_CANDIDATES) -> List[Dict[str, Any]]:
+    """
+    Fetch the filtered items whose text best matches an item's title.
+    
+    Args:
+        collection: MongoDB collection with the title/content text index
+        item: The item being checked
+        limit: Maximum number of candidates to return
+        
+    Returns:
+        Candidate items (title only), best text score first
+    """
+    title = item.get('title', '').strip()
+    if not title:
+        return []
+    cursor = collection.find(
+        {'$text': {'$search': title}, 'filtered': True, '_id': {'$ne': item.get('_id')}},
+        {'title': 1, 'score': {'$meta': 'textScore'}}
+    ).sort([('score', {'$meta': 'textScore'})]).limit(limit)
+    return list(cursor)
+
+# English word analyzer (token pattern + stop words) built once and shared by every content vectorizer
+_content_analyzer = HashingVectorizer(stop_words='english').build_analyzer()
+
+def vectorize_content(content_index: Dict[str, Any], texts: List[str]):
+    """
+    Turn texts into L2-normalized TF-IDF rows with the index's fixed hashing space.
+    
+    Args:
+        content_index: Index created by build_content_index
+        texts: Texts to vectorize
+        
+    Returns:
+        Sparse matrix with one normalized row per text
+    """
+    counts = content_index['vectorizer'].transform(texts)
+    if content_index['idf'] is not None:
+        return content_index['idf'].transform(counts)
+    return normalize(counts)
+
+def content_hash(text: str) -> str:
+    """SHA-256 of lowercased, whitespace-normalized text; matches content_aggregator.content_hash."""
+    return hashlib.sha256(' '.join(text.lower().split()).encode('utf-8')).hexdigest()
+
+def content_simhash(content: str):
+    """64-bit SimHash fingerprint over the lowercased word shingles of a text."""
+    words = _RE_WORD.findall(content.lower())
+    shingles = [' '.join(words[start:start + SIMHASH_SHINGLE_SIZE])
+                for start in range(max(len(words) - SIMHASH_SHINGLE_SIZE + 1, 1))]
+    return Simhash(shingles)
+
+# Population count in C: int.bit_count on Python 3.10+, otherwise counting '1's in the binary string
+_popcount = getattr(int, 'bit_count', None) or (lambda value: bin(value).count('1'))
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two SimHash fingerprint values."""
+    return _popcount(a ^ b)
+
+def simhash_near_rows(content_index: Dict[str, Any], fingerprint) -> List[int]:
+    """
+    Find the content rows whose SimHash is within SIMHASH_MAX_DISTANCE bits of a fingerprint.
+    
+    Candidates come from the SimhashIndex buckets; their distance is checked with the
+    C-level popcount instead of get_near_dups, which re-checks each with a Python bit loop.
+    
+    Args:
+        content_index: Index created by build_content_index (with a 'simhash' index)
+        fingerprint: Simhash of the new content
+        
+    Returns:
+        Matching matrix rows, ascending
+    """
+    simhash_index = content_index['simhash']
+    fingerprints = content_index['fingerprints']
+    rows = {int(entry.split(',', 1)[1]) for key in simhash_index.get_keys(fingerprint)
+            for entry in simhash_index.bucket.get(key, ())}
+    return sorted(row for row in rows if hamming_distance(fingerprint.value, fingerprints[row]) <= SIMHASH_MAX_DISTANCE)
+
+def content_minhash(content: str):
+    """
+    Build a MinHash over the lowercased word set of a text.
+    
+    Args:
+        content: Text to hash
+        
+    Returns:
+        datasketch MinHash for the text
+    """
+    minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+    for word in set(_RE_WORD.findall(content.lower())):
+        minhash.update(word.encode('utf-8'))
+    return minhash
+
+def build_content_index(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Vectorize the content of existing items once for duplicate detection.
+    
+    Texts are hashed into a fixed feature space, so new rows never require a
+    vocabulary refit. IDF weights are fit once over the existing items. When
+    datasketch is available, a MinHash LSH over each text's words selects the
+    rows that are scored precisely. Exact content hashes and, when simhash is
+    available, SimHash candidates (confirmed by their TF-IDF rows) catch
+    (near-)identical copies before that.
+    
+    Args:
+        items: List of existing items
+        
+    Returns:
+        Dict with the hashing 'vectorizer', the 'idf' transformer (None when there
+        were no existing texts), the L2-normalized TF-IDF 'matrix', the 'lsh' index
+        keyed by matrix row (None when datasketch is unavailable), the set of content
+        'hashes', and the 'simhash' index keyed by matrix row with its row
+        'fingerprints' as integer values (None when simhash is unavailable)
+    """
+    texts = [text for text in (item.get('content_summary', '').strip() for item in items) if text]
+    vectorizer = HashingVectorizer(analyzer=_content_analyzer, n_features=CONTENT_HASH_FEATURES,
+                                   alternate_sign=False, norm=None, dtype=np.float32)
+    content_index = {'vectorizer': vectorizer, 'idf': None, 'matrix': None, 'lsh': None,
+                     'hashes': {content_hash(text) for text in texts}, 'simhash': None, 'fingerprints': []}
+    if texts:
+        counts = vectorizer.transform(texts)
+        content_index['idf'] = TfidfTransformer().fit(counts)
+        content_index['matrix'] = content_index['idf'].transform(counts)
+    if DATASKETCH_AVAILABLE:
+        content_index['lsh'] = MinHashLSH(threshold=CONTENT_LSH_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+        for row, text in enumerate(texts):
+            content_index['lsh'].insert(row, content_minhash(text))
+    if SIMHASH_AVAILABLE:
+        fingerprints = [content_simhash(text) for text in texts]
+        content_index['fingerprints'] = [fingerprint.value for fingerprint in fingerprints]
+        content_index['simhash'] = SimhashIndex(
+            [(str(row), fingerprint) for row, fingerprint in enumerate(fingerprints)], k=SIMHASH_MAX_DISTANCE)
+    return content_index
+
+def add_to_content_index(content_index: Dict[str, Any], content: str) -> None:
+    """
+    Append an accepted item's content to a content index.
+    
+    Args:
+        content_index: Index created by build_content_index
+        content: The accepted item's content
+    """
+    content = content.strip()
+    if not content:
+        return
+    new_row = vectorize_content(content_index, [content])
+    if content_index['matrix'] is None:
+        content_index['matrix'] = new_row
+    else:
+        content_index['matrix'] = vstack([content_index['matrix'], new_row], format='csr')
+    row = content_index['matrix'].shape[0] - 1
+    if content_index['lsh'] is not None:
+        content_index['lsh'].insert(row, content_minhash(content))
+    content_index['hashes'].add(content_hash(content))
+    if content_index['simhash'] is not None:
+        fingerprint = content_simhash(content)
+        content_index['fingerprints'].append(fingerprint.value)
+        content_index['simhash'].add(str(row), fingerprint)
+
+def title_token_prefixes(title: str) -> frozenset:
+    """Set of 4-character word prefixes of a lowercased title, used to block fuzzy comparisons."""
+    return frozenset(word[:4] for word in title.split())
+
+def add_to_exact_index(exact_index: Dict[str, Any], item: Dict[str, Any]) -> None:
+    """
+    Add an item's URL and lowercased title to an exact-match index.
+    
+    Args:
+        exact_index: Index created by build_exact_index
+        item: The item to add
+    """
+    url = item.get('url', '').strip()
+    if url:
+        exact_index['urls'].add(url)
+    title = item.get('title', '').strip().lower()
+    if title:
+        exact_index['titles'][title] = title_token_prefixes(title)
+
+def build_exact_index(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build O(1) lookups for exact URL and title duplicates.
+    
+    Args:
+        items: List of existing items
+        
+    Returns:
+        Dict with a 'urls' set and a 'titles' dict mapping each lowercased title to
+        its word prefixes (see title_token_prefixes)
+    """
+    exact_index = {'urls': set(), 'titles': {}}
+    for item in items:
+        add_to_exact_index(exact_index, item)
+    return exact_index
+
+def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]], title_index=None,
+                 title_candidates: List[Dict[str, Any]] = None,
+                 content_index: Dict[str, Any] = None,
+                 exact_index: Dict[str, Any] = None) -> Tuple[bool, str, float]:
     """
     Check if an item is a duplicate of any existing items.
     
     Args:
         new_item: The new item to check
         existing_items: List of existing items to check against
+        title_index: Optional MinHashLSH over existing_items titles (see build_title_index);
+            when given, titles are only compared against LSH candidates
+        title_candidates: Optional pre-selected items to compare titles against
+            (e.g. from find_title_candidates), used when there is no title_index
+        content_index: Optional TF-IDF index over existing_items content (see
+            build_content_index); when given, nothing is refit per item
+        exact_index: Optional URL/title lookups over existing_items (see
+            build_exact_index); when given, exact checks are dict lookups
         
     Returns:
         Tuple of (is_duplicate, duplicate_reason, similarity_score)
@@ -382,27 +972,82 @@ def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]])
     # Check exact URL matches
     new_url = new_item.get('url', '').strip()
     if new_url:
-        for item in existing_items:
-            if item.get('url', '').strip() == new_url:
+        if exact_index is not None:
+            if new_url in exact_index['urls']:
                 return True, "Exact URL match", 1.0
+        else:
+            for item in existing_items:
+                if item.get('url', '').strip() == new_url:
+                    return True, "Exact URL match", 1.0
     
     # Check exact title matches
     new_title = new_item.get('title', '').strip()
     if new_title and len(new_title) > MIN_TITLE_LENGTH:
-        for item in existing_items:
-            existing_title = item.get('title', '').strip()
-            if existing_title and new_title.lower() == existing_title.lower():
-                return True, "Exact title match", 1.0
-            
-            # Check for very similar titles (over 90% similar)
-            if existing_title:
-                title_similarity = difflib.SequenceMatcher(None, new_title.lower(), existing_title.lower()).ratio()
-                if title_similarity > 0.9:  # 90% similarity threshold for titles
+        new_title_lower = new_title.lower()
+        if exact_index is not None and new_title_lower in exact_index['titles']:
+            return True, "Exact title match", 1.0
+        
+        if title_index is not None:
+            candidates = [existing_items[position] for position in
+                          sorted(title_index.query(title_minhash(new_title_lower, new_item.get('_id'))))]
+        elif title_candidates is not None:
+            candidates = title_candidates
+        else:
+            candidates = existing_items
+        existing_titles = [title for title in (item.get('title', '').strip().lower() for item in candidates) if title]
+        if new_title_lower in existing_titles:
+            return True, "Exact title match", 1.0
+        
+        # Check for very similar titles (over 90% similar)
+        if RAPIDFUZZ_AVAILABLE:
+            # Score every candidate in one C call and keep only the best
+            best = rapidfuzz_process.extractOne(new_title_lower, existing_titles, scorer=fuzz.ratio,
+                                                score_cutoff=TITLE_SIMILARITY_THRESHOLD * 100)
+            if best is not None and best[1] / 100.0 > TITLE_SIMILARITY_THRESHOLD:
+                title_similarity = best[1] / 100.0
+                return True, f"Similar title ({title_similarity:.2f})", title_similarity
+        else:
+            new_prefixes = title_token_prefixes(new_title_lower)
+            for existing_title in existing_titles:
+                if exact_index is not None:
+                    # Skip the full ratio for titles that share too few words to be near-duplicates
+                    existing_prefixes = exact_index['titles'].get(existing_title) or title_token_prefixes(existing_title)
+                    union = len(new_prefixes | existing_prefixes)
+                    if union and len(new_prefixes & existing_prefixes) / union < TITLE_BLOCK_JACCARD:
+                        continue
+                title_similarity = similarity_score(new_title_lower, existing_title, TITLE_SIMILARITY_THRESHOLD)
+                if title_similarity > TITLE_SIMILARITY_THRESHOLD:
                     return True, f"Similar title ({title_similarity:.2f})", title_similarity
     
     # Check content similarity using TF-IDF and cosine similarity
     new_content = new_item.get('content_summary', '').strip()
-    if new_content and len(new_content) > MIN_CONTENT_LENGTH:
+    if new_content and len(new_content) > MIN_CONTENT_LENGTH and content_index is not None:
+        # Fast path: identical or near-identical copies never reach TF-IDF
+        if content_hash(new_content) in content_index['hashes']:
+            return True, "Exact content match", 1.0
+        if content_index['matrix'] is not None:
+            try:
+                matrix = content_index['matrix']
+                # Rows are L2-normalized, so the dot product is the cosine similarity
+                new_vector = vectorize_content(content_index, [new_content])
+                if content_index['simhash'] is not None:
+                    # SimHash hits are only candidates; confirm them against their TF-IDF rows first
+                    near_rows = simhash_near_rows(content_index, content_simhash(new_content))
+                    if near_rows:
+                        near_similarity = float((matrix[near_rows] @ new_vector.T).toarray().max())
+                        if near_similarity > MAX_DUPLICATE_SCORE:
+                            return True, f"Near-identical content ({near_similarity:.2f})", near_similarity
+                if content_index['lsh'] is not None:
+                    # Only score the rows that share enough words to be candidates
+                    candidate_rows = sorted(content_index['lsh'].query(content_minhash(new_content)))
+                    matrix = matrix[candidate_rows]
+                cosine_similarities = (matrix @ new_vector.T).toarray().ravel()
+                max_similarity = float(cosine_similarities.max()) if cosine_similarities.size else 0.0
+                if max_similarity > MAX_DUPLICATE_SCORE:
+                    return True, f"Content similarity ({max_similarity:.2f})", max_similarity
+            except Exception as e:
+                logger.warning(f"Error calculating content similarity: {e}")
+    elif new_content and len(new_content) > MIN_CONTENT_LENGTH:
         existing_contents = [item.get('content_summary', '').strip() for item in existing_items 
                             if item.get('content_summary', '').strip()]
         
@@ -412,7 +1057,7 @@ def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]])
                 all_contents = existing_contents + [new_content]
                 
                 # Create TF-IDF vectors
-                vectorizer = TfidfVectorizer(stop_words='english')
+                vectorizer = TfidfVectorizer(analyzer=_content_analyzer, dtype=np.float32)
                 tfidf_matrix = vectorizer.fit_transform(all_contents)
                 
                 # Get the vector for the new content (last in the list)
@@ -421,10 +1066,9 @@ def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]])
                 # Calculate cosine similarity between new content and existing contents
                 cosine_similarities = cosine_similarity(new_vector, tfidf_matrix[:-1]).flatten()
                 
-                # Check if any similarity exceeds the threshold
-                max_similarity = max(cosine_similarities)
+                # Check if any similarity exceeds the threshold (one vectorized pass)
+                max_similarity = float(cosine_similarities.max())
                 if max_similarity > MAX_DUPLICATE_SCORE:
-                    most_similar_idx = cosine_similarities.argmax()
                     return True, f"Content similarity ({max_similarity:.2f})", max_similarity
                 
             except Exception as e:
@@ -432,6 +1076,101 @@ def is_duplicate(new_item: Dict[str, Any], existing_items: List[Dict[str, Any]])
     
     return False, "", 0.0
 
+def iter_quality_phrases(lower_text: str):
+    """
+    Yield the AD/CLICKBAIT/FLUFF phrases occurring in a lowercased text, from a single pass.
+    
+    Phrases may be yielded more than once; matching uses Hyperscan, Aho-Corasick or
+    the lookahead regex, whichever is available.
+    
+    Args:
+        lower_text: Lowercased text to scan
+    """
+    if HYPERSCAN_AVAILABLE:
+        for phrase_id, _, _ in scan_phrases(_quality_database, lower_text.encode('utf-8')):
+            yield _quality_phrase_list[phrase_id]
+    elif AHOCORASICK_AVAILABLE:
+        for _, phrase in _quality_automaton.iter(lower_text):
+            yield phrase
+    else:
+        for match in _RE_QUALITY_PHRASES.finditer(lower_text):
+            phrase = match.group(1)
+            yield phrase
+            yield from _quality_subphrases[phrase]
+
+def find_quality_phrases(lower_text: str) -> Dict[str, set]:
+    """
+    Find the AD/CLICKBAIT/FLUFF phrases present in a text in one pass.
+    
+    Args:
+        lower_text: Lowercased text to scan
+        
+    Returns:
+        Dict mapping category ('ad', 'clickbait', 'fluff') to the set of distinct phrases found
+    """
+    found = set(iter_quality_phrases(lower_text))
+    
+    phrases_by_category = {'ad': set(), 'clickbait': set(), 'fluff': set()}
+    for phrase in found:
+        for category in QUALITY_PHRASE_CATEGORIES[phrase]:
+            phrases_by_category[category].add(phrase)
+    return phrases_by_category
+
+def url_domain(url: str) -> str:
+    """
+    Get the network location of a URL, splitting the string directly for the usual scheme://host form.
+    
+    Args:
+        url: The URL
+        
+    Returns:
+        The host (with port, if any), or '' when the URL has none
+    """
+    parts = url.split('/', 3)
+    if len(parts) > 2 and parts[0].endswith(':') and not parts[1]:
+        return parts[2].split('?', 1)[0].split('#', 1)[0]
+    return urlparse(url).netloc
+
+def score_domain(url: str) -> Tuple[float, List[str]]:
+    """
+    Score an item's URL domain, caching the verdict per domain.
+    
+    Args:
+        url: The item URL
+        
+    Returns:
+        Tuple of (score_delta, list_of_quality_factors)
+    """
+    domain = url_domain(url)
+    verdict = _domain_verdict_cache.get(domain)
+    if verdict is None:
+        delta = 0.0
+        factors = []
+        # Check for suspicious TLDs
+        if domain.endswith(SUSPICIOUS_TLDS):
+            delta -= 0.1
+            factors.append(f"Suspicious domain TLD: {domain}")
+        
+        # Check for very short domains (often low quality)
+        lower_domain = domain.lower()
+        if len(domain) < 10 and '.' in domain and not any(reputable in lower_domain for reputable in REPUTABLE_SOURCES):
+            delta -= 0.05
+            factors.append(f"Very short domain: {domain}")
+        verdict = _domain_verdict_cache[domain] = (delta, factors)
+    return verdict
+
+def has_clickbait_phrase(lower_title: str) -> bool:
+    """
+    Check a lowercased title for any clickbait phrase, stopping at the first hit.
+    
+    Args:
+        lower_title: Lowercased title
+        
+    Returns:
+        True if the title contains a clickbait phrase
+    """
+    return any('clickbait' in QUALITY_PHRASE_CATEGORIES[phrase] for phrase in iter_quality_phrases(lower_title))
+
 def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
     """
     Calculate a quality score for the item based on various factors.
@@ -470,25 +1209,23 @@ def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
         score += 0.05
         quality_factors.append("Descriptive title")
     
-    # Enhanced noise phrase detection (including Ad, Clickbait, and Fluff detection)
-    lower_content = content.lower()
-    lower_title = title.lower()
+    # Enhanced noise phrase detection (including Ad, Clickbait, and Fluff detection).
+    # Content is lowercased and scanned once for all categories; the title only until a clickbait hit.
+    content_phrases = find_quality_phrases(content.lower())
     
     # Check for clickbait patterns in title
-    for phrase in CLICKBAIT_PHRASES:
-        if phrase in lower_title:
-            score -= 0.15
-            quality_factors.append("Clickbait title detected")
-            break
+    if title and has_clickbait_phrase(title.lower()):
+        score -= 0.15
+        quality_factors.append("Clickbait title detected")
     
     # Check for ad content
-    ad_count = sum(phrase in lower_content for phrase in AD_PHRASES)
+    ad_count = len(content_phrases['ad'])
     if ad_count:
         score -= 0.1 * min(1, ad_count / 2)
         quality_factors.append(f"Contains {ad_count} ad phrases")
     
     # Check for fluff content
-    fluff_count = sum(phrase in lower_content for phrase in FLUFF_PHRASES)
+    fluff_count = len(content_phrases['fluff'])
     if fluff_count:
         score -= 0.05 * min(1, fluff_count / 3)
         quality_factors.append(f"Contains {fluff_count} fluff phrases")
@@ -497,10 +1234,10 @@ def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
     if content:
         # Calculate sentence complexity (average words per sentence)
         try:
-            sentences = sent_tokenize(content)
+            sentences = split_sentences(content)
             if sentences:
-                words = word_tokenize(content)
-                avg_words_per_sentence = len(words) / len(sentences)
+                # Whitespace word count is enough for an average-length heuristic
+                avg_words_per_sentence = len(content.split()) / len(sentences)
                 
                 if avg_words_per_sentence > 25:
                     score += 0.1
@@ -524,13 +1261,9 @@ def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
     source = item.get('source', '')
     if source:
         # Add a small bonus for known reputable sources
-        reputable_sources = ['cnn', 'bbc', 'reuters', 'ap', 'associated press', 
-                             'nytimes', 'new york times', 'washingtonpost', 'washington post',
-                             'economist', 'nature', 'science', 'national geographic',
-                             'guardian', 'npr', 'pbs', 'aljazeera', 'theverge']
-        
-        for reputable in reputable_sources:
-            if reputable in source.lower():
+        lower_source = source.lower()
+        for reputable in REPUTABLE_SOURCES:
+            if reputable in lower_source:
                 score += 0.1
                 quality_factors.append(f"Reputable source: {source}")
                 break
@@ -539,18 +1272,9 @@ def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
     url = item.get('url', '')
     if url:
         try:
-            domain = urlparse(url).netloc
-            
-            # Check for suspicious TLDs
-            suspicious_tlds = ['.xyz', '.info', '.biz', '.click', '.club', '.top']
-            if any(domain.endswith(tld) for tld in suspicious_tlds):
-                score -= 0.1
-                quality_factors.append(f"Suspicious domain TLD: {domain}")
-            
-            # Check for very short domains (often low quality)
-            if len(domain) < 10 and '.' in domain and not any(reputable in domain.lower() for reputable in reputable_sources):
-                score -= 0.05
-                quality_factors.append(f"Very short domain: {domain}")
+            domain_delta, domain_factors = score_domain(url)
+            score += domain_delta
+            quality_factors.extend(domain_factors)
         except Exception:
             pass
     
@@ -573,26 +1297,75 @@ def calculate_quality_score(item: Dict[str, Any]) -> Tuple[float, List[str]]:
     
     return score, quality_factors
 
-def process_content(collection, limit=0, debug=False):
+def flush_updates(collection, ops: List) -> None:
+    """
+    Send queued item updates in one unordered bulk write and clear the queue.
+    
+    Args:
+        collection: MongoDB collection
+        ops: List of pymongo UpdateOne operations
+    """
+    if not ops:
+        return
+    try:
+        result = collection.bulk_write(ops, ordered=False)
+        logger.debug(f"Bulk write: {result.modified_count} items updated")
+    except BulkWriteError as e:
+        logger.error(f"Bulk write errors: {e.details.get('writeErrors', [])[:5]}")
+    ops.clear()
+
+def queue_update(collection, ops: List, item_id, fields: Dict[str, Any]) -> None:
+    """
+    Queue a $set update for an item, flushing every WRITE_BATCH_SIZE operations.
+    
+    Args:
+        collection: MongoDB collection
+        ops: Pending operations
+        item_id: The item's _id
+        fields: Fields to set
+    """
+    ops.append(UpdateOne({"_id": item_id}, {"$set": fields}))
+    if len(ops) >= WRITE_BATCH_SIZE:
+        flush_updates(collection, ops)
+
+def clean_and_score(item: Dict[str, Any]) -> Tuple[Dict[str, Any], str, List[str], float, List[str]]:
+    """
+    Clean and score one item; pure CPU work that can run in a worker process.
+    
+    Args:
+        item: The item to process
+        
+    Returns:
+        Tuple of (item, cleaned_content, modifications, quality_score, quality_factors)
+    """
+    cleaned_content, modifications = clean_content(item.get("content_summary", ""))
+    quality_score, quality_factors = calculate_quality_score(item)
+    return item, cleaned_content, modifications, quality_score, quality_factors
+
+def process_content(collection, limit=0, debug=False, workers=1):
     """
     Process content from MongoDB collection.
     
+    Cleaning and quality scoring run in a process pool; duplicate detection and
+    writes stay in this process, in cursor order.
+    
     Args:
         collection: MongoDB collection
         limit: Maximum number of items to process (0 for all)
         debug: Enable debug mode
+        workers: Number of worker processes (1 to process inline)
     """
     # Query unfiltered content
     query = {"filtered": {"$ne": True}}
     
     # Apply limit if specified
-    cursor = collection.find(query)
+    cursor = collection.find(query).batch_size(CURSOR_BATCH_SIZE)
     if limit > 0:
         cursor = cursor.limit(limit)
     
-    # Count items to process
-    count = collection.count_documents(query) if limit == 0 else min(limit, collection.count_documents(query))
-    logger.info(f"Processing {count} unfiltered content items")
+    # Upper bound for progress logging: a metadata read instead of counting unfiltered items
+    max_items = limit if limit > 0 else collection.estimated_document_count()
+    logger.info(f"Processing up to {max_items} unfiltered content items")
     
     # Track statistics
     stats = {
@@ -604,90 +1377,115 @@ def process_content(collection, limit=0, debug=False):
     }
     
     # Get existing items for duplicate detection (up to 1000 recent items)
-    existing_items = list(collection.find({"filtered": True}).sort("timestamp", -1).limit(1000))
+    existing_items = list(collection.find({"filtered": True}, projection=EXISTING_ITEM_FIELDS)
+                          .sort("timestamp", -1).limit(1000))
     logger.info(f"Loaded {len(existing_items)} existing items for duplicate detection")
+    title_index = build_title_index(existing_items)
+    content_index = build_content_index(existing_items)
+    exact_index = build_exact_index(existing_items)
+    # Without LSH, let the text index preselect title candidates instead of scanning every item
+    use_text_search = title_index is None and ensure_text_index(collection)
+    # Items accepted since the last flush, which the text search cannot see until their updates land
+    accepted_items = []
+    # Updates are queued and sent in bulk rather than one round trip per item
+    pending_updates = []
     
-    # Process each item
-    for item in cursor:
-        item_id = item.get("_id")
-        original_content = item.get("content_summary", "")
-        
-        if debug:
-            logger.debug(f"Processing item {item_id}: {item.get('title', '')[:50]}...")
-        
-        # Clean content
-        cleaned_content, modifications = clean_content(original_content)
-        
-        # Skip if content is too short after cleaning
-        if len(cleaned_content) < MIN_CONTENT_LENGTH:
-            logger.info(f"Filtered out {item_id}: Content too short after cleaning ({len(cleaned_content)} chars)")
-            collection.update_one(
-                {"_id": item_id},
-                {"$set": {"filtered": True, "filter_reason": "Content too short", "quality_score": 0}}
-            )
-            stats["filtered_out"] += 1
-            stats["processed"] += 1
-            continue
-        
-        # Check for duplicates
-        is_dup, dup_reason, similarity = is_duplicate(item, existing_items)
-        if is_dup:
-            logger.info(f"Filtered out {item_id}: Duplicate content - {dup_reason}")
-            collection.update_one(
-                {"_id": item_id},
-                {"$set": {
+    # Clean and score items in parallel; imap keeps cursor order so duplicate resolution is unchanged
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    if pool is not None:
+        results = pool.imap(clean_and_score, cursor, chunksize=WORKER_CHUNK_SIZE)
+    else:
+        results = map(clean_and_score, cursor)
+    
+    # Queued updates are flushed and the pool is stopped even if processing fails midway
+    try:
+        # Process each item
+        for item, cleaned_content, modifications, quality_score, quality_factors in results:
+            item_id = item.get("_id")
+        
+            if debug:
+                logger.debug(f"Processing item {item_id}: {item.get('title', '')[:50]}...")
+        
+            # Skip if content is too short after cleaning
+            if len(cleaned_content) < MIN_CONTENT_LENGTH:
+                logger.info(f"Filtered out {item_id}: Content too short after cleaning ({len(cleaned_content)} chars)")
+                queue_update(collection, pending_updates, item_id,
+                             {"filtered": True, "filter_reason": "Content too short", "quality_score": 0})
+                stats["filtered_out"] += 1
+                stats["processed"] += 1
+                continue
+        
+            # Check for duplicates
+            title_candidates = None
+            if use_text_search:
+                # An empty queue means every accepted item has been written and is found by the text search
+                if not pending_updates:
+                    accepted_items.clear()
+                try:
+                    title_candidates = find_title_candidates(collection, item) + accepted_items
+                except Exception as e:
+                    logger.warning(f"Text search failed, scanning all titles: {e}")
+            is_dup, dup_reason, similarity = is_duplicate(item, existing_items, title_index, title_candidates,
+                                                          content_index, exact_index)
+            if is_dup:
+                logger.info(f"Filtered out {item_id}: Duplicate content - {dup_reason}")
+                queue_update(collection, pending_updates, item_id, {
                     "filtered": True,
                     "filter_reason": f"Duplicate: {dup_reason}",
                     "similarity_score": similarity
-                }}
-            )
-            stats["duplicates"] += 1
-            stats["filtered_out"] += 1
-            stats["processed"] += 1
-            continue
+                })
+                stats["duplicates"] += 1
+                stats["filtered_out"] += 1
+                stats["processed"] += 1
+                continue
         
-        # Calculate quality score
-        quality_score, quality_factors = calculate_quality_score(item)
-        
-        # Filter out low-quality content
-        if quality_score < QUALITY_THRESHOLD:
-            logger.info(f"Filtered out {item_id}: Low quality score ({quality_score:.2f})")
-            collection.update_one(
-                {"_id": item_id},
-                {"$set": {
+            # Filter out low-quality content
+            if quality_score < QUALITY_THRESHOLD:
+                logger.info(f"Filtered out {item_id}: Low quality score ({quality_score:.2f})")
+                queue_update(collection, pending_updates, item_id, {
                     "filtered": True,
                     "filter_reason": f"Low quality ({quality_score:.2f})",
                     "quality_score": quality_score,
                     "quality_factors": quality_factors
-                }}
-            )
-            stats["low_quality"] += 1
-            stats["filtered_out"] += 1
-            stats["processed"] += 1
-            continue
+                })
+                stats["low_quality"] += 1
+                stats["filtered_out"] += 1
+                stats["processed"] += 1
+                continue
         
-        # Update the item with cleaned content and quality information
-        collection.update_one(
-            {"_id": item_id},
-            {"$set": {
+            # Update the item with cleaned content and quality information
+            queue_update(collection, pending_updates, item_id, {
                 "content_summary": cleaned_content,
                 "filtered": True,
                 "quality_score": quality_score,
                 "quality_factors": quality_factors,
                 "content_modifications": modifications,
                 "filter_timestamp": datetime.datetime.utcnow()
-            }}
-        )
+            })
         
-        # Add to existing items for future duplicate detection
-        item["content_summary"] = cleaned_content
-        existing_items.append(item)
+            # Add to existing items for future duplicate detection
+            item["content_summary"] = cleaned_content
+            add_to_title_index(title_index, item, len(existing_items))
+            add_to_content_index(content_index, cleaned_content)
+            add_to_exact_index(exact_index, item)
+            existing_items.append(item)
+            if use_text_search:
+                accepted_items.append(item)
         
-        stats["cleaned"] += 1
-        stats["processed"] += 1
+            stats["cleaned"] += 1
+            stats["processed"] += 1
         
-        if debug and stats["processed"] % 10 == 0:
-            logger.debug(f"Progress: {stats['processed']}/{count} items processed")
+            if debug and stats["processed"] % 10 == 0:
+                logger.debug(f"Progress: {stats['processed']}/{max_items} items processed (upper bound)")
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        # A failed flush is logged so it never replaces an exception raised by the loop
+        try:
+            flush_updates(collection, pending_updates)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(pending_updates)} queued updates: {e}")
     
     # Log final statistics
     logger.info("Content filtering completed:")
@@ -717,7 +1515,7 @@ def main():
     
     try:
         # Process content
-        stats = process_content(collection, limit=args.limit, debug=args.debug)
+        stats = process_content(collection, limit=args.limit, debug=args.debug, workers=args.workers)
         
         # Provide a summary
         logger.info("=== Content Filter Summary ===")
@@ -6,7 +6,7 @@ This module provides advanced filtering and quality assessment for content:
 - Duplicate detection using TF-IDF and cosine similarity
 - Quality filtering with NLP (readability, sentiment, spam detection)
 - Noise removal (ads, fluff, boilerplate)
-- Multithreaded processing for scalability
+- Parallel processing across worker processes for scalability
 """
 
 import os
@@ -15,14 +15,17 @@ import json
 import logging
 import argparse
 import datetime
-from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import difflib
+import html
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, List, Tuple
 import re
 
 # Required dependencies
 try:
-    from pymongo import MongoClient
-    from pymongo.errors import ConnectionFailure
+    from pymongo import MongoClient, DeleteOne, UpdateOne
+    from pymongo.errors import ConnectionFailure, BulkWriteError
 except ImportError:
     print("Error: pymongo required. Install with: pip install pymongo")
     sys.exit(1)
@@ -34,29 +37,43 @@ except ImportError:
     sys.exit(1)
 
 try:
-    import nltk
-    from nltk.tokenize import sent_tokenize, word_tokenize
-    from nltk.corpus import stopwords
-    # Ensure NLTK resources are downloaded
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline
+    from sklearn.decomposition import TruncatedSVD
+    from scipy.sparse import vstack as sparse_vstack
 except ImportError:
-    print("Warning: nltk required. Install with: pip install nltk")
-    nltk = None
+    print("Warning: scikit-learn required. Install with: pip install scikit-learn")
+    HashingVectorizer = None
 
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    import numpy as np
 except ImportError:
-    print("Warning: scikit-learn required. Install with: pip install scikit-learn")
-    TfidfVectorizer = None
-    cosine_similarity = None
+    print("Warning: numpy not installed. Install with: pip install numpy")
+    np = None
+
+try:
+    from simhash import Simhash, SimhashIndex
+except ImportError:
+    print("Warning: simhash not installed, skipping near-duplicate fast path. Install with: pip install simhash")
+    Simhash = None
+    SimhashIndex = None
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
 
 try:
-    import readability
+    import faiss
 except ImportError:
-    print("Warning: readability not installed. Install with: pip install readability-lxml")
-    readability = None
+    print("Warning: faiss not installed, large windows use exact similarity. Install with: pip install faiss-cpu")
+    faiss = None
+
+try:
+    import ahocorasick
+except ImportError:
+    print("Warning: pyahocorasick not installed, using per-phrase scans. Install with: pip install pyahocorasick")
+    ahocorasick = None
 
 # Setup logging
 logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs')
@@ -78,7 +95,8 @@ parser.add_argument('--quality-threshold', type=float, default=0.5, help='Qualit
 parser.add_argument('--similarity-threshold', type=float, default=0.85, help='Similarity threshold for duplicates (0-1)')
 parser.add_argument('--dryrun', action='store_true', help='Run without database changes')
 parser.add_argument('--verbose', action='store_true', help='Show detailed analysis')
-parser.add_argument('--workers', type=int, default=4, help='Number of worker threads')
+parser.add_argument('--workers', type=int, default=4, help='Number of worker processes')
+parser.add_argument('--batch-size', type=int, default=500, help='Database operations per bulk write')
 args = parser.parse_args()
 
 # Load environment variables
@@ -94,57 +112,319 @@ try:
     db = client['glovepost']
     content_collection = db['contents']
     logger.info(f"Connected to MongoDB. Found {content_collection.count_documents({})} documents")
+    # Support the exact URL/title duplicate grouping
+    content_collection.create_index('url')
+    content_collection.create_index('title')
+    content_collection.create_index('content_hash')
+    # Lets the newest-first window be read off an index instead of sorting the collection in memory
+    content_collection.create_index([('timestamp', -1)])
 except ConnectionFailure as e:
     logger.error(f"Failed to connect to MongoDB: {e}")
     sys.exit(1)
 
-# Noise phrase lists (expanded)
-AD_PHRASES = [
+# Noise phrase lists (expanded); kept lowercase, since the automaton matches lowercased content
+AD_PHRASES = (
     "sponsored content", "advertisement", "paid content", "promoted by", "buy now",
     "limited time offer", "discount code", "subscribe today", "shop now", "free trial",
     "advertisement feature", "click here", "exclusive offer", "promo code", "sign up now"
-]
+)
 
-CLICKBAIT_PHRASES = [
+CLICKBAIT_PHRASES = (
     "you won't believe", "shocking truth", "this one trick", "will blow your mind",
     "secrets revealed", "find out how", "click to see", "don't miss out", "game changer",
     "mind blowing", "jaw-dropping", "you'll never guess", "this will change everything",
     "unbelievable", "amazing", "incredible", "revolutionary", "number 7 will surprise you",
     "what happens next", "doctors hate", "crazy trick", "simple trick", "find out why"
-]
+)
 
-FLUFF_PHRASES = [
+FLUFF_PHRASES = (
     "in today's world", "at the end of the day", "experts say", "studies show",
     "it goes without saying", "needless to say", "in conclusion", "many people believe",
     "in today's fast-paced world", "in this day and age", "as we all know", 
     "when all is said and done", "the fact of the matter is", "according to experts",
     "according to research", "sources say", "many people are saying"
-]
+)
+
+# Precompiled patterns for scoring and cleaning
+# Sentences are the runs between . ! ? terminators; words are \w+ runs
+_RE_SENTENCE = re.compile(r'[^.!?]+')
+_RE_WORD = re.compile(r'\w+')
+# Vowel groups approximate syllables for the Flesch reading ease
+_RE_SYLLABLE = re.compile(r'[aeiouy]+', re.IGNORECASE)
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_SOURCE_LINK = re.compile(r'Source\s*:?\s*https?://\S+', re.IGNORECASE)
+_RE_TRAILING_SOURCE = re.compile(r'Source$', re.IGNORECASE)
+# Runs of !/? collapse to '!', runs of 4+ dots to '...'
+_RE_EXCESS_PUNCT = re.compile(r'([!?]{2,})|(\.{4,})')
+# ALL-CAPS words of 6+ letters; shorter runs are kept as likely acronyms
+_RE_ALLCAPS = re.compile(r'\b[A-Z]{6,}\b')
+_RE_LEADING_DATE = re.compile(r'^\d{1,2}/\d{1,2}/\d{2,4}\s+')
+
+def _fix_punct(match):
+    return '!' if match.group(1) else '...'
+
+def _fix_caps(match):
+    # Matches are ASCII-only, so slicing and lower() equal capitalize() without its Unicode case mapping
+    word = match.group(0)
+    return word[0] + word[1:].lower()
+
+NOISE_PHRASE_LISTS = ((AD_PHRASES, "ad"), (CLICKBAIT_PHRASES, "clickbait"), (FLUFF_PHRASES, "fluff"))
+
+# Score penalty per noise label: (max penalty, phrase count at which it is reached)
+NOISE_PENALTIES = {'ad': (0.2, 2), 'clickbait': (0.15, 2), 'fluff': (0.1, 3)}
+
+# One Aho-Corasick automaton finds every noise phrase in a single pass over the text
+noise_automaton = None
+if ahocorasick:
+    noise_automaton = ahocorasick.Automaton()
+    for phrase_list, label in NOISE_PHRASE_LISTS:
+        for phrase in phrase_list:
+            noise_automaton.add_word(phrase, (phrase, label))
+    noise_automaton.make_automaton()
+
+# Without the automaton, one case-insensitive lookahead alternation over the original text reports
+# the longest phrase starting at each position (its group number indexes _noise_by_length);
+# shorter phrases that are prefixes of it are recovered through _noise_prefixes
+_noise_labels = {phrase: label for phrase_list, label in NOISE_PHRASE_LISTS for phrase in phrase_list}
+_noise_by_length = sorted(_noise_labels, key=len, reverse=True)
+_RE_NOISE_PHRASES = re.compile('(?=(?:' + '|'.join(f'({re.escape(phrase)})' for phrase in _noise_by_length) + '))',
+                               re.IGNORECASE)
+_noise_prefixes = {phrase: [other for other in _noise_labels if other != phrase and phrase.startswith(other)]
+                   for phrase in _noise_labels}
+# Case-insensitive removal for text whose lowercase copy changes length
+_RE_NOISE_ANYCASE = re.compile('|'.join(map(re.escape, _noise_by_length)), re.IGNORECASE)
+
+# Document fields used by the filter; everything else stays on the server
+ARTICLE_FIELDS = {
+    'url': 1, 'title': 1, 'content_summary': 1, 'timestamp': 1, 'source': 1,
+    'upvotes': 1, 'downvotes': 1, 'content_hash': 1
+}
+
+# Fields kept in memory for the whole window between the two passes; content is never held
+WINDOW_FIELDS = ('_id', 'url', 'title', 'timestamp', 'content_hash')
+
+# Max Hamming distance (of 64 bits) between SimHash fingerprints of near-duplicate candidates
+SIMHASH_MAX_DISTANCE = 3
+
+# Rows of the cosine matrix materialized at a time by find_similar_content
+SIMILARITY_BLOCK_ROWS = 512
+
+# Windows of at least this many articles look up similar pairs with FAISS HNSW neighbors over an
+# SVD embedding instead of the quadratic cosine matrix; candidates are verified on exact TF-IDF cosine
+ANN_MIN_ARTICLES = 20000
+ANN_COMPONENTS = 128
+ANN_NEIGHBORS = 10
+
+# Titles assigned by scrapers when a post has none; never treated as duplicates
+PLACEHOLDER_TITLES = ['', 'Untitled', 'Untitled Reddit Post']
 
 # Reputable sources for quality boost
 REPUTABLE_SOURCES = [
     'bbc', 'guardian', 'nytimes', 'washingtonpost', 'reuters', 'ap', 'economist',
     'nature', 'science', 'nationalgeographic', 'npr', 'aljazeera', 'theverge'
 ]
-
-# Initialize TF-IDF Vectorizer for duplicate detection
+_RE_REPUTABLE = re.compile('|'.join(map(re.escape, REPUTABLE_SOURCES)), re.IGNORECASE)
+
+# NLTK's English stop word list, inlined so the module needs no corpus download
+STOP_WORDS = frozenset('''
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself yourselves
+he him his himself she she's her hers herself it it's its itself they them their theirs themselves
+what which who whom this that that'll these those am is are was were be been being have has had
+having do does did doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down in out on off over
+under again further then once here there when where why how all any both each few more most other
+some such no nor not only own same so than too very s t can will just don don't should should've
+now d ll m o re ve y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn
+shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+'''.split())
+
+# Initialize TF-IDF Vectorizer for duplicate detection: hashed term counts need no vocabulary pass
 tfidf_vectorizer = None
-if TfidfVectorizer and nltk:
+if HashingVectorizer:
     try:
-        stop_words = set(stopwords.words('english'))
-        tfidf_vectorizer = TfidfVectorizer(stop_words=list(stop_words), max_features=5000)
+        tfidf_vectorizer = make_pipeline(
+            HashingVectorizer(n_features=2 ** 18, stop_words=list(STOP_WORDS), norm=None, alternate_sign=False,
+                              dtype=np.float32),
+            TfidfTransformer()
+        )
         logger.info("TF-IDF vectorizer initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing TF-IDF vectorizer: {e}")
         tfidf_vectorizer = None
 
-def detect_duplicate(article: Dict, articles: List[Dict]) -> Tuple[bool, str, Dict]:
-    """Detect duplicates using TF-IDF and cosine similarity."""
+def content_hash(content: str) -> str:
+    """SHA-256 of lowercased, whitespace-normalized content, for exact-duplicate lookups."""
+    return hashlib.sha256(' '.join(content.lower().split()).encode('utf-8')).hexdigest()
+
+EMPTY_CONTENT_HASH = content_hash('')
+
+def load_duplicate_keepers(field: str, ignore_values: List) -> Dict:
+    """Map each value of `field` shared by several documents to the _id of its oldest copy."""
+    pipeline = [
+        {'$match': {field: {'$nin': ignore_values}}},
+        {'$group': {
+            '_id': f'${field}',
+            'docs': {'$push': {'id': '$_id', 'ts': '$timestamp'}},
+            'count': {'$sum': 1}
+        }},
+        {'$match': {'count': {'$gt': 1}}}
+    ]
+    keepers = {}
+    for group in content_collection.aggregate(pipeline, allowDiskUse=True):
+        oldest = min(group['docs'], key=lambda doc: str(doc.get('ts', '')))
+        keepers[group['_id']] = oldest['id']
+    return keepers
+
+def seniority(article: Dict) -> Tuple[str, str]:
+    """Sort key ordering articles oldest first; of two duplicates the one with the smaller key is kept."""
+    return (str(article.get('timestamp', '')), str(article.get('_id')))
+
+def article_text(article: Dict) -> str:
+    """Lowercased title and content used for near-duplicate comparison."""
+    return f"{article.get('title', '')} {article.get('content_summary', '')}".lower()
+
+def text_similarity(text1: str, text2: str) -> float:
+    """Indel similarity ratio (0-1), via rapidfuzz when available."""
+    if fuzz is not None:
+        return fuzz.ratio(text1, text2) / 100.0
+    return difflib.SequenceMatcher(None, text1, text2).ratio()
+
+def fetch_texts(ids: List) -> Dict:
+    """Map each _id to article_text() of its document, read back in batches of --batch-size."""
+    texts = {}
+    for start in range(0, len(ids), args.batch_size):
+        query = {'_id': {'$in': ids[start:start + args.batch_size]}}
+        for doc in content_collection.find(query, projection={'title': 1, 'content_summary': 1}):
+            texts[doc['_id']] = article_text(doc)
+    return texts
+
+def find_simhash_candidates(articles: List[Dict], fingerprints: List) -> Dict:
+    """Map each article _id (as str) to the other articles within SIMHASH_MAX_DISTANCE bits of its SimHash,
+    as (article, article_text()) pairs.
+
+    fingerprints[i] is the Simhash of article_text(articles[i]); the candidates' texts are read back
+    from the database, since the window's contents are not kept in memory.
+    """
+    by_id = {}
+    keyed = []
+    for article, fingerprint in zip(articles, fingerprints):
+        key = str(article.get('_id'))
+        by_id[key] = article
+        keyed.append((key, fingerprint))
+    index = SimhashIndex(keyed, k=SIMHASH_MAX_DISTANCE)
+    candidates = {}
+    for key, fingerprint in keyed:
+        near = [by_id[dup] for dup in index.get_near_dups(fingerprint) if dup != key]
+        if near:
+            candidates[key] = near
+    texts = fetch_texts(list({article['_id'] for near in candidates.values() for article in near}))
+    return {key: [(article, texts[article['_id']]) for article in near if article['_id'] in texts]
+            for key, near in candidates.items()}
+
+def find_similar_content(articles: List[Dict], counts, keys: List[Tuple[str, str]]) -> Dict:
+    """Fit TF-IDF once over the window and map each article _id (as str) to its most similar
+    older article above the similarity threshold, as (article, score).
+
+    counts holds the hashed term counts of article_text(articles[i]) in row i, and keys[i]
+    its seniority(); the vectorizer lowercases anyway, so the lowercased texts give the same matrix.
+    """
+    tfidf_matrix = tfidf_vectorizer[-1].fit_transform(counts).tocsr()
+    if faiss is not None and len(articles) >= ANN_MIN_ARTICLES:
+        pairs = approximate_similar_pairs(tfidf_matrix)
+    else:
+        pairs = exact_similar_pairs(tfidf_matrix)
+
+    matches = {}
+    for rows, cols, scores in pairs:
+        for i, j, score in zip(rows, cols, scores):
+            # Only older copies count, so one article of each similar pair survives
+            newer, older = (i, j) if keys[j] < keys[i] else (j, i)
+            key = str(articles[newer].get('_id'))
+            if key not in matches or score > matches[key][1]:
+                matches[key] = (articles[older], float(score))
+    return matches
+
+def exact_similar_pairs(tfidf_matrix):
+    """Yield (rows, cols, scores) arrays of every pair i < j whose cosine is above the similarity threshold."""
+    transposed = tfidf_matrix.T
+    # Rows are L2-normalized, so the product is the cosine matrix. It is built a block of rows
+    # at a time as a dense float32 array and thresholded in one vectorized comparison; it is
+    # symmetric, so only pairs above the diagonal are kept and each pair is visited once
+    for start in range(0, tfidf_matrix.shape[0], SIMILARITY_BLOCK_ROWS):
+        block = (tfidf_matrix[start:start + SIMILARITY_BLOCK_ROWS] @ transposed).toarray()
+        rows, cols = np.nonzero(block > args.similarity_threshold)
+        upper = cols > rows + start
+        rows, cols = rows[upper], cols[upper]
+        yield rows + start, cols, block[rows, cols]
+
+def approximate_similar_pairs(tfidf_matrix):
+    """Yield (rows, cols, scores) arrays of pairs i < j above the similarity threshold among each
+    article's ANN_NEIGHBORS nearest neighbors; pairs the index misses are not reported."""
+    # Cosine on the SVD embedding only shortlists candidates; scores come from the TF-IDF rows
+    embedding = TruncatedSVD(n_components=ANN_COMPONENTS, random_state=0).fit_transform(tfidf_matrix)
+    embedding = np.ascontiguousarray(embedding, dtype=np.float32)
+    faiss.normalize_L2(embedding)
+    index = faiss.IndexHNSWFlat(ANN_COMPONENTS, 32, faiss.METRIC_INNER_PRODUCT)
+    index.add(embedding)
+    _, neighbors = index.search(embedding, ANN_NEIGHBORS + 1)
+
+    rows = np.repeat(np.arange(neighbors.shape[0]), neighbors.shape[1])
+    cols = neighbors.ravel()
+    # Drop self matches and the -1 padding, then order and dedupe each pair
+    valid = (cols >= 0) & (cols != rows)
+    pairs = np.unique(np.sort(np.column_stack((rows[valid], cols[valid])), axis=1), axis=0)
+    for start in range(0, len(pairs), SIMILARITY_BLOCK_ROWS):
+        rows, cols = pairs[start:start + SIMILARITY_BLOCK_ROWS].T
+        scores = np.asarray(tfidf_matrix[rows].multiply(tfidf_matrix[cols]).sum(axis=1)).ravel()
+        above = scores > args.similarity_threshold
+        yield rows[above], cols[above], scores[above]
+
+# (article, article_text(), seniority()) for the containment fallback, oldest first. Set once per
+# worker process by init_worker instead of being pickled with every batch.
+corpus = []
+
+def init_worker(window_corpus: List[Tuple[Dict, str, Tuple[str, str]]]) -> None:
+    """ProcessPoolExecutor initializer: store the window's containment-fallback corpus in this worker."""
+    global corpus
+    corpus = window_corpus
+
+def detect_duplicate(article: Dict, url_keepers: Dict = None, title_keepers: Dict = None, hash_keepers: Dict = None,
+                     simhash_candidates: Dict = None, similar_content: Dict = None) -> Tuple[bool, str, Dict]:
+    """Detect duplicates using exact URL/title/content-hash groups, SimHash near-duplicates,
+    then TF-IDF and cosine similarity.
+
+    The containment fallback reads the worker's corpus (see init_worker).
+    """
+    article_id = article.get('_id')
     url = article.get('url', '')
-    if url and url != '#':
-        for existing in articles:
-            if existing.get('url') == url and existing.get('_id') != article.get('_id'):
-                return True, "Exact URL match", existing
+    if url and url != '#' and url_keepers:
+        keeper = url_keepers.get(url)
+        if keeper is not None and keeper != article_id:
+            return True, "Exact URL match", {'_id': keeper}
+
+    if title_keepers:
+        keeper = title_keepers.get(article.get('title', ''))
+        if keeper is not None and keeper != article_id:
+            return True, "Exact title match", {'_id': keeper}
+
+    if hash_keepers:
+        keeper = hash_keepers.get(article.get('content_hash'))
+        if keeper is not None and keeper != article_id:
+            return True, "Exact content match", {'_id': keeper}
+
+    # SimHash fast path: verify the few close fingerprints directly; the oldest copy is kept
+    if simhash_candidates:
+        candidates = simhash_candidates.get(str(article_id), [])
+        if candidates:
+            text = article_text(article)
+            article_key = seniority(article)
+            for existing, existing_text in candidates:
+                if seniority(existing) >= article_key:
+                    continue
+                similarity = text_similarity(text, existing_text)
+                if similarity > args.similarity_threshold:
+                    return True, f"Near-duplicate content (score: {similarity:.2f})", existing
 
     # If we don't have TF-IDF capability, fall back to simple comparison
     if tfidf_vectorizer is None:
@@ -155,57 +435,81 @@ def detect_duplicate(article: Dict, articles: List[Dict]) -> Tuple[bool, str, Di
     if not title or not content:
         return False, None, None
 
-    # Combine title and content for vectorization
-    text = f"{title} {content}"
-    all_texts = [f"{a.get('title', '')} {a.get('content_summary', '')}" for a in articles if a.get('_id') != article.get('_id')]
-    all_texts.append(text)
-
-    if len(all_texts) < 2:
+    # Similarities were computed once for the whole window by find_similar_content
+    if similar_content is not None:
+        match = similar_content.get(str(article_id))
+        if match is not None:
+            existing, max_similarity = match
+            return True, f"Similar content (score: {max_similarity:.2f})", existing
         return False, None, None
 
+    # TF-IDF failed for the window: simple containment comparison against older copies
     try:
-        # Create a fresh vectorizer each time to avoid the "not fitted" error
-        local_vectorizer = TfidfVectorizer(stop_words=list(stopwords.words('english')), max_features=5000)
-        tfidf_matrix = local_vectorizer.fit_transform(all_texts)
-        similarity_scores = cosine_similarity(tfidf_matrix[-1], tfidf_matrix[:-1])[0]
-        
-        max_similarity = similarity_scores.max() if similarity_scores.size > 0 else 0
-        if max_similarity > args.similarity_threshold:
-            match_idx = similarity_scores.argmax()
-            return True, f"Similar content (score: {max_similarity:.2f})", articles[match_idx]
+        text = article_text(article)
+        article_key = seniority(article)
+        for existing, existing_text, existing_key in corpus:
+            if existing_key >= article_key:
+                break
+            smaller, larger = (text, existing_text) if len(text) < len(existing_text) else (existing_text, text)
+            # If the smaller text appears entirely in the larger one
+            if len(smaller) > 100 and smaller in larger:
+                return True, "Text largely contained in another article", existing
     except Exception as e:
-        logger.warning(f"Error in similarity detection: {e}")
-        # Use a fallback simple text comparison
-        try:
-            for existing in articles:
-                if existing.get('_id') != article.get('_id'):
-                    # Simple substring comparison
-                    article_text = f"{article.get('title', '')} {article.get('content_summary', '')}".lower()
-                    existing_text = f"{existing.get('title', '')} {existing.get('content_summary', '')}".lower()
-                    
-                    # Find largest common substring (simplified approach)
-                    smaller = article_text if len(article_text) < len(existing_text) else existing_text
-                    larger = existing_text if len(article_text) < len(existing_text) else article_text
-                    
-                    # If more than 50% of the smaller text appears in the larger one
-                    if len(smaller) > 100 and smaller in larger:
-                        return True, "Text largely contained in another article", existing
-        except Exception as inner_e:
-            logger.warning(f"Error in fallback similarity detection: {inner_e}")
-        
+        logger.warning(f"Error in fallback similarity detection: {e}")
+
     return False, None, None
 
-def calculate_quality_score(article: Dict) -> Tuple[float, List[str]]:
-    """Calculate quality score using NLP and heuristics."""
+def noise_scan_text(content: str) -> str:
+    """Text that find_noise_phrases scans: lowercased for the automaton, else the content itself."""
+    return content.lower() if noise_automaton is not None else content
+
+def find_noise_phrases(scan_text: str) -> Dict[str, Tuple[str, List[Tuple[int, int]]]]:
+    """Map each noise phrase found in noise_scan_text(content) to its label and match spans."""
+    matches = {}
+    if noise_automaton is not None:
+        for end_index, (phrase, label) in noise_automaton.iter(scan_text):
+            start = end_index - len(phrase) + 1
+            matches.setdefault(phrase, (label, []))[1].append((start, end_index + 1))
+        return matches
+    for match in _RE_NOISE_PHRASES.finditer(scan_text):
+        start = match.start()
+        longest = _noise_by_length[match.lastindex - 1]
+        for phrase in (longest, *_noise_prefixes[longest]):
+            matches.setdefault(phrase, (_noise_labels[phrase], []))[1].append((start, start + len(phrase)))
+    return matches
+
+def remove_spans(content: str, spans: List[Tuple[int, int]]) -> str:
+    """Remove possibly overlapping (start, end) spans from content in one join."""
+    pieces = []
+    pos = 0
+    for start, end in sorted(spans):
+        if start > pos:
+            pieces.append(content[pos:start])
+        pos = max(pos, end)
+    pieces.append(content[pos:])
+    return ''.join(pieces)
+
+def flesch_reading_ease(content: str, word_count: int, sentence_count: int) -> float:
+    """Flesch reading ease of content from its word and sentence counts, counting vowel groups as syllables."""
+    syllable_count = sum(1 for _ in _RE_SYLLABLE.finditer(content))
+    return 206.835 - 1.015 * (word_count / sentence_count) - 84.6 * (syllable_count / word_count)
+
+def calculate_quality_score(article: Dict, scan_text: str = None) -> Tuple[float, List[str], Dict]:
+    """Calculate quality score using NLP and heuristics.
+
+    scan_text is noise_scan_text() of the article's content_summary, if the caller has it.
+    Also returns the noise-phrase matches found while scoring so clean_article_content can reuse them.
+    """
     score = 0.5  # Base score
     reasons = []
+    noise_matches = None
 
     content = article.get('content_summary', '')
     title = article.get('title', '')
     if not content or not title:
         score -= 0.4
         reasons.append("Missing content or title")
-        return score, reasons
+        return score, reasons, noise_matches
 
     # Length check
     content_length = len(content)
@@ -217,59 +521,45 @@ def calculate_quality_score(article: Dict) -> Tuple[float, List[str]]:
         reasons.append("Substantial content length")
 
     # Noise detection
-    lower_content = content.lower()
-    ad_count = sum(phrase in lower_content for phrase in AD_PHRASES)
-    clickbait_count = sum(phrase in lower_content for phrase in CLICKBAIT_PHRASES)
-    fluff_count = sum(phrase in lower_content for phrase in FLUFF_PHRASES)
+    if scan_text is None:
+        scan_text = noise_scan_text(content)
+    phrase_counts = dict.fromkeys(NOISE_PENALTIES, 0)
+    noise_matches = find_noise_phrases(scan_text)
+    for label, _ in noise_matches.values():
+        phrase_counts[label] += 1
     
-    if ad_count:
-        score -= 0.2 * min(1, ad_count / 2)
-        reasons.append(f"Contains {ad_count} ad phrases")
-    if clickbait_count:
-        score -= 0.15 * min(1, clickbait_count / 2)
-        reasons.append(f"Contains {clickbait_count} clickbait phrases")
-    if fluff_count:
-        score -= 0.1 * min(1, fluff_count / 3)
-        reasons.append(f"Contains {fluff_count} fluff phrases")
-
-    # Readability (if available)
-    if readability:
-        try:
-            readability_score = readability.getmeasures(content, lang='en')['readability grades']['FleschReadingEase']
-            if readability_score > 60:
-                score += 0.1
-                reasons.append("High readability")
-            elif readability_score < 30:
-                score -= 0.1
-                reasons.append("Low readability")
-        except Exception as e:
-            logger.warning(f"Readability calculation failed: {e}")
+    for label, count in phrase_counts.items():
+        if count:
+            weight, saturation = NOISE_PENALTIES[label]
+            score -= weight * min(1, count / saturation)
+            reasons.append(f"Contains {count} {label} phrases")
+
+    # Sentence and word counts, shared by readability and sentence structure
+    sentence_count = sum(1 for sentence in _RE_SENTENCE.findall(content) if not sentence.isspace())
+    word_count = sum(1 for _ in _RE_WORD.finditer(content))
+
+    # Readability
+    if sentence_count and word_count:
+        readability_score = flesch_reading_ease(content, word_count, sentence_count)
+        if readability_score > 60:
+            score += 0.1
+            reasons.append("High readability")
+        elif readability_score < 30:
+            score -= 0.1
+            reasons.append("Low readability")
 
-    # Sentence structure (if nltk available)
-    if nltk:
-        try:
-            sentences = sent_tokenize(content)
-            if len(sentences) > 0:
-                avg_sentence_length = sum(len(word_tokenize(s)) for s in sentences) / len(sentences)
-                if avg_sentence_length < 5:
-                    score -= 0.1
-                    reasons.append("Very short sentences")
-                elif avg_sentence_length > 20:
-                    score += 0.05
-                    reasons.append("Complex sentence structure")
-        except Exception as e:
-            logger.warning(f"Sentence analysis failed: {e}")
-    else:
-        # Fallback to regex-based sentence detection
-        sentences = re.split(r'[.!?]', content)
-        short_sentences = [s for s in sentences if len(s.strip().split()) < 4 and len(s.strip()) > 0]
-        if len(short_sentences) > len(sentences) / 2 and len(sentences) > 3:
+    # Sentence structure: every word falls in exactly one sentence, so the average is a ratio of totals
+    if sentence_count:
+        avg_sentence_length = word_count / sentence_count
+        if avg_sentence_length < 5:
             score -= 0.1
-            reasons.append("Predominantly very short sentences")
+            reasons.append("Very short sentences")
+        elif avg_sentence_length > 20:
+            score += 0.05
+            reasons.append("Complex sentence structure")
 
     # Source reputation
-    source = article.get('source', '').lower()
-    if any(rs in source for rs in REPUTABLE_SOURCES):
+    if _RE_REPUTABLE.search(article.get('source', '')):
         score += 0.15
         reasons.append("Reputable source")
     
@@ -281,10 +571,15 @@ def calculate_quality_score(article: Dict) -> Tuple[float, List[str]]:
         score += feedback_score * 0.1
         reasons.append(f"User feedback adjusted score: {feedback_score:.2f}")
 
-    return max(0.0, min(1.0, score)), reasons
+    return max(0.0, min(1.0, score)), reasons, noise_matches
 
-def clean_article_content(article: Dict) -> Tuple[str, List[str]]:
-    """Clean article content by removing noise and normalizing text."""
+def clean_article_content(article: Dict, scan_text: str = None,
+                          noise_matches: Dict = None) -> Tuple[str, List[str]]:
+    """Clean article content by removing noise and normalizing text.
+
+    scan_text is noise_scan_text() of the article's content_summary, and noise_matches
+    the find_noise_phrases() result for it, if the caller has them.
+    """
     content = article.get('content_summary', '')
     if not content:
         return content, []
@@ -295,94 +590,94 @@ def clean_article_content(article: Dict) -> Tuple[str, List[str]]:
     if '<' in content and '>' in content:
         # Simple HTML stripping
         original_length = len(content)
-        content = re.sub(r'<[^>]+>', ' ', content)
-        content = re.sub(r'\s+', ' ', content).strip()
-        
-        # Replace common HTML entities
-        html_entities = {
-            '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&#39;': "'",
-            '&nbsp;': ' ', '&copy;': '©', '&reg;': '®', '&trade;': '™',
-            '&eacute;': 'é', '&Eacute;': 'É', '&egrave;': 'è', '&Egrave;': 'È',
-            '&agrave;': 'à', '&Agrave;': 'À', '&acirc;': 'â', '&Acirc;': 'Â',
-            '&icirc;': 'î', '&Icirc;': 'Î', '&oacute;': 'ó', '&Oacute;': 'Ó',
-            '&uacute;': 'ú', '&Uacute;': 'Ú', '&hellip;': '…', '&mdash;': '—',
-            '&ndash;': '–', '&lsquo;': ''', '&rsquo;': ''', '&ldquo;': '"',
-            '&rdquo;': '"', '&bull;': '•', '&middot;': '·'
-        }
+        content = _RE_HTML_TAG.sub(' ', content)
+        content = ' '.join(content.split())
         
-        for entity, replacement in html_entities.items():
-            if entity in content:
-                content = content.replace(entity, replacement)
-                
+        # Decode every named and numeric HTML entity in one pass
+        content = html.unescape(content)
+
         # Remove source link if it exists
-        content = re.sub(r'Source\s*:?\s*https?://\S+', '', content, flags=re.IGNORECASE)
-        content = re.sub(r'Source$', '', content, flags=re.IGNORECASE)
+        content = _RE_SOURCE_LINK.sub('', content)
+        content = _RE_TRAILING_SOURCE.sub('', content)
                 
         if len(content) != original_length:
             modifications.append("Removed HTML formatting")
+        # The cached scan text and match offsets no longer fit the stripped text
+        scan_text = None
+        noise_matches = None
     
     # Remove noise phrases
-    for phrase_list, label in [(AD_PHRASES, "ad"), (CLICKBAIT_PHRASES, "clickbait"), (FLUFF_PHRASES, "fluff")]:
-        for phrase in phrase_list:
-            if phrase in content.lower():
-                content = re.sub(re.escape(phrase), '', content, flags=re.IGNORECASE)
-                modifications.append(f"Removed {label} phrase: '{phrase}'")
+    if scan_text is None:
+        scan_text = noise_scan_text(content)
+    matches = noise_matches if noise_matches is not None else find_noise_phrases(scan_text)
+    if matches:
+        # Match offsets only line up with the original text if lowercasing kept its length
+        if len(scan_text) == len(content):
+            content = remove_spans(content, [span for _, spans in matches.values() for span in spans])
+        else:
+            content = _RE_NOISE_ANYCASE.sub('', content)
+        for phrase_list, label in NOISE_PHRASE_LISTS:
+            for phrase in phrase_list:
+                if phrase in matches:
+                    modifications.append(f"Removed {label} phrase: '{phrase}'")
 
     # Normalize text
-    content = re.sub(r'\s+', ' ', content).strip()
-    content = re.sub(r'[!?]{2,}', '!', content)
-    content = re.sub(r'\.{4,}', '...', content)
-    
-    # Handle ALL CAPS text while preserving acronyms
-    def _fix_caps(match):
-        word = match.group(0)
-        # Preserve likely acronyms
-        if len(word) <= 5:
-            return word
-        return word.capitalize()
+    content = ' '.join(content.split())
+    content = _RE_EXCESS_PUNCT.sub(_fix_punct, content)
     
-    content = re.sub(r'\b[A-Z]{4,}\b', _fix_caps, content)
+    # Handle ALL CAPS text while preserving acronyms; text with no uppercase letter has nothing to fix
+    if not content.islower():
+        content = _RE_ALLCAPS.sub(_fix_caps, content)
     
     # Remove date patterns at the beginning of the content
-    content = re.sub(r'^\d{1,2}/\d{1,2}/\d{2,4}\s+', '', content)
+    content = _RE_LEADING_DATE.sub('', content)
     
     if modifications:
         modifications.append("Normalized text formatting")
 
     return content, modifications
 
-def process_article(article: Dict, all_articles: List[Dict]) -> Dict:
-    """Process a single article for filtering and cleaning."""
-    stats = {'is_duplicate': False, 'low_quality': False, 'cleaned': False, 'deleted': False}
+def process_article(article: Dict, url_keepers: Dict = None, title_keepers: Dict = None, hash_keepers: Dict = None,
+                    simhash_candidates: Dict = None, similar_content: Dict = None) -> Dict:
+    """Process a single article for filtering and cleaning.
+
+    The database change is not applied here; it is returned under stats['op']
+    so the caller can batch it into a bulk write.
+    """
+    stats = {'is_duplicate': False, 'low_quality': False, 'cleaned': False, 'deleted': False, 'op': None}
     
     # Duplicate check
-    is_duplicate, reason, match = detect_duplicate(article, all_articles)
+    is_duplicate, reason, match = detect_duplicate(article, url_keepers, title_keepers, hash_keepers,
+                                                   simhash_candidates, similar_content)
     if is_duplicate:
         stats['is_duplicate'] = True
         stats['reason'] = reason
         if not args.dryrun:
-            content_collection.delete_one({'_id': article['_id']})
+            stats['op'] = DeleteOne({'_id': article['_id']})
             stats['deleted'] = True
         return stats
 
+    # Prepare the noise scan text once for both scoring and cleaning
+    scan_text = noise_scan_text(article.get('content_summary', ''))
+
     # Quality check
-    quality_score, quality_reasons = calculate_quality_score(article)
+    quality_score, quality_reasons, noise_matches = calculate_quality_score(article, scan_text)
     if quality_score < args.quality_threshold:
         stats['low_quality'] = True
         stats['reason'] = f"Quality score {quality_score:.2f} < {args.quality_threshold}"
         if not args.dryrun:
-            content_collection.delete_one({'_id': article['_id']})
+            stats['op'] = DeleteOne({'_id': article['_id']})
             stats['deleted'] = True
         return stats
 
     # Clean content
-    cleaned_content, modifications = clean_article_content(article)
+    cleaned_content, modifications = clean_article_content(article, scan_text, noise_matches)
     if modifications:
         stats['cleaned'] = True
         if not args.dryrun:
-            content_collection.update_one(
+            stats['op'] = UpdateOne(
                 {'_id': article['_id']},
-                {'$set': {'content_summary': cleaned_content}}
+                {'$set': {'content_summary': cleaned_content, 'content_hash': content_hash(cleaned_content)}}
             )
 
     if args.verbose:
@@ -392,22 +687,187 @@ def process_article(article: Dict, all_articles: List[Dict]) -> Dict:
 
     return stats
 
+def process_chunk(chunk: List[Dict], url_keepers: Dict = None, title_keepers: Dict = None, hash_keepers: Dict = None,
+                  simhash_candidates: Dict = None, similar_content: Dict = None) -> List[Dict]:
+    """Run process_article over a batch of articles in a worker process.
+
+    A failing article yields {'error': message} instead of aborting the batch.
+    """
+    results = []
+    for article in chunk:
+        try:
+            results.append(process_article(article, url_keepers, title_keepers, hash_keepers,
+                                           simhash_candidates, similar_content))
+        except Exception as e:
+            results.append({'error': f"Error processing article {article.get('_id')}: {e}"})
+    return results
+
+def chunk_context(chunk: List[Dict], keepers: Dict, field: str) -> Dict:
+    """Subset of a keepers dict (or per-_id dict when field is None) covering only a chunk's articles."""
+    if keepers is None:
+        return None
+    if field is None:
+        return {key: keepers[key] for key in (str(article.get('_id')) for article in chunk) if key in keepers}
+    return {value: keepers[value] for value in (article.get(field) for article in chunk)
+            if value is not None and value in keepers}
+
+def flush_operations(ops: List) -> None:
+    """Send queued delete/update operations in unordered bulk writes of at most --batch-size and clear the queue."""
+    for start in range(0, len(ops), args.batch_size):
+        try:
+            result = content_collection.bulk_write(ops[start:start + args.batch_size], ordered=False)
+            logger.info(f"Bulk write: {result.deleted_count} deleted, {result.modified_count} updated")
+        except BulkWriteError as e:
+            logger.error(f"Bulk write errors: {e.details.get('writeErrors', [])[:5]}")
+    ops.clear()
+
+def scan_window() -> Tuple[List[Dict], object, List, List[Dict]]:
+    """First pass: stream the newest --limit articles once, keeping only WINDOW_FIELDS per article
+    plus the hashed term counts and SimHash fingerprints of their text.
+
+    Returns (articles, counts, fingerprints, missing_hash); counts or fingerprints is None when
+    that pass is unavailable, and missing_hash lists the articles whose content_hash was backfilled.
+    """
+    cursor = content_collection.find({}, projection=ARTICLE_FIELDS).sort('timestamp', -1).limit(args.limit).batch_size(500)
+    hashing = tfidf_vectorizer[0] if tfidf_vectorizer is not None else None
+    articles, missing_hash, batch_texts = [], [], []
+    count_batches = [] if hashing is not None else None
+    fingerprints = [] if Simhash is not None else None
+    for doc in cursor:
+        text = article_text(doc)
+        article = {field: doc[field] for field in WINDOW_FIELDS if field in doc}
+        # Backfill hashes for articles stored before content_hash existed
+        if not article.get('content_hash'):
+            article['content_hash'] = content_hash(doc.get('content_summary') or '')
+            missing_hash.append(article)
+        articles.append(article)
+        if fingerprints is not None:
+            fingerprints.append(Simhash(text.split()))
+        if count_batches is not None:
+            batch_texts.append(text)
+            if len(batch_texts) >= args.batch_size:
+                count_batches = add_count_batch(hashing, count_batches, batch_texts)
+    if count_batches is not None and batch_texts:
+        count_batches = add_count_batch(hashing, count_batches, batch_texts)
+    counts = sparse_vstack(count_batches).tocsr() if count_batches else None
+    return articles, counts, fingerprints, missing_hash
+
+def add_count_batch(hashing, count_batches: List, batch_texts: List[str]):
+    """Append the hashed term counts of batch_texts to count_batches and clear the texts;
+    returns None, dropping TF-IDF for this run, if hashing fails."""
+    try:
+        count_batches.append(hashing.transform(batch_texts))
+    except Exception as e:
+        logger.warning(f"TF-IDF term counting failed, falling back to containment checks: {e}")
+        count_batches = None
+    batch_texts.clear()
+    return count_batches
+
+def fetch_articles(chunk: List[Dict]) -> List[Dict]:
+    """Second pass: read the ARTICLE_FIELDS of a chunk of window articles back from the database,
+    carrying over content hashes backfilled in the first pass."""
+    by_id = {article['_id']: article for article in chunk}
+    docs = list(content_collection.find({'_id': {'$in': list(by_id)}}, projection=ARTICLE_FIELDS))
+    for doc in docs:
+        doc['content_hash'] = by_id[doc['_id']]['content_hash']
+    return docs
+
 def filter_and_clean_content():
     """Main function to filter and clean content."""
-    articles = list(content_collection.find().sort('timestamp', -1).limit(args.limit))
+    # Two passes over the window keep only one batch of article contents in memory at a time:
+    # the first streams it once for the duplicate passes, the second reads each batch back
+    # for scoring and cleaning
+    articles, counts, fingerprints, missing_hash = scan_window()
     logger.info(f"Processing {len(articles)} articles")
+    if missing_hash and not args.dryrun:
+        flush_operations([UpdateOne({'_id': article['_id']}, {'$set': {'content_hash': article['content_hash']}})
+                          for article in missing_hash])
 
-    stats = {'processed': 0, 'duplicates': 0, 'low_quality': 0, 'cleaned': 0, 'deleted': 0}
-    
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        futures = [executor.submit(process_article, article, articles) for article in articles]
-        for future in futures:
-            result = future.result()
+    keys = [seniority(article) for article in articles]
+
+    # Resolve exact URL/title/content collisions server-side in one pass each; the oldest copy is kept
+    try:
+        url_keepers = load_duplicate_keepers('url', ['', '#', None])
+        title_keepers = load_duplicate_keepers('title', PLACEHOLDER_TITLES + [None])
+        hash_keepers = load_duplicate_keepers('content_hash', ['', None, EMPTY_CONTENT_HASH])
+        logger.info(f"Found {len(url_keepers)} duplicated URLs, {len(title_keepers)} duplicated titles "
+                    f"and {len(hash_keepers)} duplicated contents")
+    except Exception as e:
+        logger.warning(f"Duplicate grouping failed, falling back to in-memory URL grouping: {e}")
+        url_keepers = {}
+        for index in sorted(range(len(articles)), key=keys.__getitem__):
+            article = articles[index]
+            url = article.get('url')
+            if url and url != '#':
+                url_keepers.setdefault(url, article['_id'])
+        title_keepers, hash_keepers = None, None
+
+    simhash_candidates = find_simhash_candidates(articles, fingerprints) if fingerprints is not None else None
+
+    similar_content = None
+    if counts is not None:
+        try:
+            similar_content = find_similar_content(articles, counts, keys)
+        except Exception as e:
+            logger.warning(f"TF-IDF similarity failed, falling back to containment checks: {e}")
+    del counts, fingerprints
+
+    stats = {'processed': 0, 'duplicates': 0, 'low_quality': 0, 'cleaned': 0, 'deleted': 0, 'errors': 0}
+    ops = []
+
+    def collect(future, chunk):
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(chunk)} articles: {e}")
+            stats['errors'] += len(chunk)
+            return
+        for result in results:
+            if 'error' in result:
+                logger.error(result['error'])
+                stats['errors'] += 1
+                continue
             stats['processed'] += 1
             stats['duplicates'] += int(result['is_duplicate'])
             stats['low_quality'] += int(result['low_quality'])
             stats['cleaned'] += int(result['cleaned'])
             stats['deleted'] += int(result['deleted'])
+            if result['op'] is not None:
+                ops.append(result['op'])
+                if len(ops) >= args.batch_size:
+                    flush_operations(ops)
+
+    # Scoring and cleaning are CPU-bound, so they run in worker processes. Each worker gets a
+    # batch of articles plus only the keeper/candidate entries for that batch; the whole window's
+    # texts are only read back for the containment fallback, and handed to each worker once.
+    # Stats and queued writes stay in this process. At most two batches per worker are in flight,
+    # and they are collected in completion order so one slow batch doesn't hold back the bulk writes.
+    window_corpus = []
+    if tfidf_vectorizer is not None and similar_content is None and articles:
+        texts = fetch_texts([article['_id'] for article in articles])
+        window_corpus = sorted(((article, texts[article['_id']], key) for article, key in zip(articles, keys)
+                         if article['_id'] in texts), key=lambda entry: entry[2])
+    workers = max(1, args.workers)
+    chunk_size = max(1, min(args.batch_size, -(-len(articles) // (workers * 4))))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(window_corpus,)) as executor:
+        pending = {}
+        for start in range(0, len(articles), chunk_size):
+            window_chunk = articles[start:start + chunk_size]
+            chunk = fetch_articles(window_chunk)
+            future = executor.submit(process_chunk, chunk,
+                                     chunk_context(window_chunk, url_keepers, 'url'),
+                                     chunk_context(window_chunk, title_keepers, 'title'),
+                                     chunk_context(window_chunk, hash_keepers, 'content_hash'),
+                                     chunk_context(window_chunk, simhash_candidates, None),
+                                     chunk_context(window_chunk, similar_content, None))
+            pending[future] = chunk
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, pending.pop(future))
+        for future in wait(pending).done:
+            collect(future, pending.pop(future))
+    flush_operations(ops)
 
     logger.info("=== Content Filter Summary ===")
     for key, value in stats.items():
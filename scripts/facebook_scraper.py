@@ -14,6 +14,7 @@ import random
 import datetime
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin
 import sys
 import urllib3
@@ -24,19 +25,43 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 # Optional dependencies - handle gracefully if not available
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests.exceptions import RequestException
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("Warning: requests not installed. Use: pip install requests")
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, NavigableString, CData
+    import soupsieve as sv
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
     print("Warning: beautifulsoup4 not installed. Use: pip install beautifulsoup4")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("Warning: orjson not installed, using the standard json module. Use: pip install orjson")
+
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    print("Warning: selectolax not installed, parsing mbasic pages with BeautifulSoup. Use: pip install selectolax")
+
+try:
+    import lxml
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    print("Warning: lxml not installed, parsing with the slower html.parser. Use: pip install lxml")
+
 try:
     from fake_useragent import UserAgent
     UA_AVAILABLE = True
@@ -45,7 +70,8 @@ except ImportError:
     print("Warning: fake_useragent not installed. Use: pip install fake-useragent")
 
 try:
-    from pymongo import MongoClient
+    from pymongo import MongoClient, UpdateOne
+    from pymongo.errors import BulkWriteError
     MONGODB_AVAILABLE = True
 except ImportError:
     MONGODB_AVAILABLE = False
@@ -90,6 +116,7 @@ parser.add_argument('--pages', type=str, default='BBCNews,CNN,reuters,nytimes,Th
                    help='Comma-separated list of Facebook page names to scrape')
 parser.add_argument('--limit', type=int, default=10, help='Number of posts to retrieve per page')
 parser.add_argument('--dryrun', action='store_true', help='Run without saving to database')
+parser.add_argument('--workers', type=int, default=5, help='Number of pages fetched concurrently')
 args = parser.parse_args()
 
 # Parse pages from comma-separated string to list
@@ -97,8 +124,53 @@ if isinstance(args.pages, str):
     args.pages = [page.strip() for page in args.pages.split(',') if page.strip()]
     logger.info(f"Processing {len(args.pages)} page names from comma-separated list")
 
-# MongoDB collection
+# CSS selectors run on every post container, compiled once
+if BS4_AVAILABLE:
+    POST_MESSAGE_SELECTOR = sv.compile('div[data-testid="post_message"]')
+    DIR_AUTO_SELECTOR = sv.compile('div[dir="auto"]')
+    POSTS_LINK_SELECTOR = sv.compile('a[href*="/posts/"]')
+    PHOTOS_LINK_SELECTOR = sv.compile('a[href*="/photos/"]')
+    STORY_LINK_SELECTOR = sv.compile('a[href*="/story.php"]')
+    PHOTO_LINK_SELECTOR = sv.compile('a[href*="/photo.php"]')
+    PARAGRAPH_SELECTOR = sv.compile('p')
+    TIMESTAMP_SELECTOR = sv.compile('abbr')
+
+# Post container selectors for mbasic pages, most specific first
+MBASIC_CONTAINER_SELECTORS = (
+    'article',
+    'div[role="article"]',
+    'div.du, div.dv, div.cy, div.dw',  # Common mbasic post classes
+    '#m_story_permalink_view, .story_body_container',  # Story items
+)
+
+# Shared HTTP session: every request goes to facebook.com, so pooled keep-alive
+# connections skip a TCP/TLS handshake per page
+SESSION = None
+if REQUESTS_AVAILABLE:
+    SESSION = requests.Session()
+    SESSION.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=max(10, args.workers),
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    ))
+    SESSION.headers.update({
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    })
+
+# MongoDB collections
 content_collection = None
+# Per-page ETag/Last-Modified validators and the posts parsed from that version of the page
+page_meta_collection = None
+
+# Max upserts sent in one bulk write
+WRITE_BATCH_SIZE = 500
+
+# Max bytes of a page read before it is parsed; the rest of the response is discarded
+MAX_RESPONSE_BYTES = 2_000_000
 
 # Load environment variables if available
 if DOTENV_AVAILABLE:
@@ -125,6 +197,7 @@ if MONGODB_AVAILABLE:
         
         # Use collection named 'contents' to match what we defined in the Node.js model
         content_collection = db['contents']
+        page_meta_collection = db['page_meta']
         
         # Test connection
         client.admin.command('ping')
@@ -134,6 +207,8 @@ if MONGODB_AVAILABLE:
         content_count = content_collection.count_documents({})
         logger.info(f"Found {content_count} documents in contents collection")
         
+        page_meta_collection.create_index('url', unique=True)
+        
     except Exception as e:
         logger.warning(f"MongoDB connection error: {e}")
         logger.warning("Content will not be stored in database")
@@ -141,56 +216,270 @@ if MONGODB_AVAILABLE:
 else:
     logger.warning("MongoDB not available (pymongo not installed). Content will not be stored")
 
-# Content categorization function (reused from content_aggregator)
+# Categorization keywords (same as content_aggregator), mapped to their category index
+CATEGORY_KEYWORDS = {
+    'Tech': ['technology', 'software', 'programming', 'ai', 'robot', 'computer', 'code', 
+            'app', 'startup', 'digital', 'cyber', 'data', 'internet'],
+    'Business': ['business', 'economy', 'market', 'stock', 'finance', 'trade', 'investment',
+               'company', 'industry', 'economic', 'corporate', 'profit'],
+    'Sports': ['sport', 'game', 'team', 'player', 'match', 'tournament', 'championship',
+             'football', 'soccer', 'basketball', 'baseball', 'olympic'],
+    'Entertainment': ['movie', 'music', 'celebrity', 'film', 'tv', 'television', 'show',
+                    'actor', 'actress', 'director', 'entertainment', 'star', 'media'],
+    'Health': ['health', 'medical', 'disease', 'treatment', 'doctor', 'patient',
+             'medicine', 'drug', 'hospital', 'symptom', 'wellness', 'fitness'],
+    'Politics': ['politics', 'government', 'policy', 'election', 'president', 'minister',
+               'law', 'vote', 'campaign', 'political', 'democrat', 'republican']
+}
+CATEGORY_NAMES = list(CATEGORY_KEYWORDS)
+KEYWORD_CATEGORY = {keyword: i for i, keywords in enumerate(CATEGORY_KEYWORDS.values()) for keyword in keywords}
+
+# Pages that only post in one vertical; their posts skip keyword categorization
+PAGE_CATEGORY = {
+    'techcrunch': 'Tech',
+    'wired': 'Tech',
+    'espn': 'Sports',
+}
+
+# One lookahead alternation finds the longest keyword starting at every position, so keywords
+# still match inside words and overlapping each other; keywords that are prefixes of the
+# matched one (e.g. 'star' in 'startup') are recovered through _KEYWORD_PREFIXES
+_RE_KEYWORDS = re.compile('(?=(' + '|'.join(map(re.escape, sorted(KEYWORD_CATEGORY, key=len, reverse=True))) + '))')
+_KEYWORD_PREFIXES = {keyword: [other for other in KEYWORD_CATEGORY if other != keyword and keyword.startswith(other)]
+                     for keyword in KEYWORD_CATEGORY}
+
 def categorize_content(text, title=""):
+    """Pick the category with the most distinct keywords in the title and text"""
     # Combine title and text for better categorization
     combined_text = (title + " " + text).lower()
     
-    categories = {
-        'Tech': ['technology', 'software', 'programming', 'ai', 'robot', 'computer', 'code', 
-                'app', 'startup', 'digital', 'cyber', 'data', 'internet'],
-        'Business': ['business', 'economy', 'market', 'stock', 'finance', 'trade', 'investment',
-                   'company', 'industry', 'economic', 'corporate', 'profit'],
-        'Sports': ['sport', 'game', 'team', 'player', 'match', 'tournament', 'championship',
-                 'football', 'soccer', 'basketball', 'baseball', 'olympic'],
-        'Entertainment': ['movie', 'music', 'celebrity', 'film', 'tv', 'television', 'show',
-                        'actor', 'actress', 'director', 'entertainment', 'star', 'media'],
-        'Health': ['health', 'medical', 'disease', 'treatment', 'doctor', 'patient',
-                 'medicine', 'drug', 'hospital', 'symptom', 'wellness', 'fitness'],
-        'Politics': ['politics', 'government', 'policy', 'election', 'president', 'minister',
-                   'law', 'vote', 'campaign', 'political', 'democrat', 'republican']
-    }
+    found = set()
+    for keyword in _RE_KEYWORDS.findall(combined_text):
+        found.add(keyword)
+        found.update(_KEYWORD_PREFIXES[keyword])
     
-    # Check for category keywords
-    category_scores = {}
-    for category, keywords in categories.items():
-        score = 0
-        for keyword in keywords:
-            if keyword in combined_text:
-                score += 1
-        if score > 0:
-            category_scores[category] = score
+    scores = [0] * len(CATEGORY_NAMES)
+    for keyword in found:
+        scores[KEYWORD_CATEGORY[keyword]] += 1
     
-    # Return the category with highest score, or General if none found
-    if category_scores:
-        return max(category_scores.items(), key=lambda x: x[1])[0]
-    else:
-        return 'General'
+    # Return the category with highest score (first one on ties), or General if none found
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return CATEGORY_NAMES[best] if scores[best] else 'General'
+
+# Common user agents used when fake_useragent is unavailable
+FALLBACK_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0'
+]
+
+# UserAgent() loads its browser data on construction, so build it once
+user_agent_generator = None
+if UA_AVAILABLE:
+    try:
+        user_agent_generator = UserAgent()
+    except Exception as e:
+        logger.warning(f"Could not initialize fake_useragent, using fallback user agents: {e}")
 
 def get_random_user_agent():
     """Get a random user agent to avoid blocking"""
-    if UA_AVAILABLE:
-        ua = UserAgent()
-        return ua.random
-    else:
-        # Fallback common user agents
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Safari/605.1.15',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0'
-        ]
-        return random.choice(user_agents)
+    if user_agent_generator is not None:
+        return user_agent_generator.random
+    return random.choice(FALLBACK_USER_AGENTS)
+
+def fetch_html(url, headers, **kwargs):
+    """GET url on SESSION, streaming at most MAX_RESPONSE_BYTES of the body.
+
+    Returns (response, body bytes); the connection is released before returning.
+    """
+    # Try with verify=False to handle SSL certificate issues
+    response = SESSION.get(url, headers=headers, timeout=10, verify=False, stream=True, **kwargs)
+    chunks = []
+    total = 0
+    try:
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_RESPONSE_BYTES:
+                logger.warning(f"Response from {url} truncated at {MAX_RESPONSE_BYTES} bytes")
+                break
+    finally:
+        response.close()
+    return response, b''.join(chunks)
+
+# A desktop page this small that mentions login is a login wall, not a page of posts
+LOGIN_PAGE_MAX_BYTES = 50_000
+
+def is_html(response):
+    """Whether the response is HTML; a missing Content-Type is given the benefit of the doubt"""
+    content_type = response.headers.get('Content-Type', '')
+    return not content_type or 'html' in content_type.lower()
+
+def json_dumps(obj):
+    """Indented JSON for logging, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, default=str)
+
+def facebook_url(href):
+    """Absolute URL for an mbasic link; its hrefs are nearly always root-relative paths"""
+    if href.startswith('/') and not href.startswith('//'):
+        return 'https://facebook.com' + href
+    return urljoin("https://facebook.com", href)
+
+def load_page_meta(url):
+    """Validators and posts saved from the last successful scrape of url, or None"""
+    if not MONGODB_AVAILABLE:
+        return None
+    try:
+        return page_meta_collection.find_one({'url': url})
+    except Exception as e:
+        logger.warning(f"Could not load cached page metadata for {url}: {e}")
+        return None
+
+def conditional_headers(meta):
+    """If-None-Match/If-Modified-Since headers for a cached page, so an unchanged page returns 304"""
+    headers = {}
+    if meta:
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+def cached_posts(url, response, meta):
+    """The cached posts for url if the server answered 304 Not Modified, else None"""
+    if response.status_code == 304 and meta:
+        logger.info(f"{url} not modified, reusing {len(meta.get('posts', []))} cached posts")
+        return meta.get('posts', [])
+    return None
+
+def save_page_meta(url, response, posts):
+    """Remember the page's validators with the posts parsed from it, for the next run's conditional GET"""
+    if not MONGODB_AVAILABLE or args.dryrun:
+        return
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    try:
+        page_meta_collection.update_one(
+            {'url': url},
+            {'$set': {'etag': etag, 'last_modified': last_modified, 'posts': posts,
+                      'fetched_at': datetime.datetime.now().isoformat()}},
+            upsert=True
+        )
+    except Exception as e:
+        logger.warning(f"Could not save page metadata for {url}: {e}")
+
+def text_lengths(soup):
+    """Map id() of every tag in soup to len(tag.get_text().strip()), in one pass.
+
+    Calling get_text() on every div re-joins the text of all its descendants, once per
+    ancestor. Instead each node is summarized as (length, leading whitespace, trailing
+    whitespace) of its text, and a tag's summary is combined from its children's. In
+    reversed document order every node comes after all of its descendants.
+    """
+    summaries = {}
+    lengths = {}
+    for node in reversed(list(soup.descendants)):
+        if isinstance(node, NavigableString):
+            # get_text() only joins plain strings, skipping comments, scripts and styles
+            if type(node) in (NavigableString, CData):
+                summaries[id(node)] = (len(node), len(node) - len(node.lstrip()), len(node) - len(node.rstrip()))
+            continue
+        children = [summaries.get(id(child), (0, 0, 0)) for child in node.children]
+        length = sum(child[0] for child in children)
+        lead = 0
+        for child_length, child_lead, _ in children:
+            lead += child_lead
+            if child_lead < child_length:
+                break
+        trail = 0
+        for child_length, _, child_trail in reversed(children):
+            trail += child_trail
+            if child_trail < child_length:
+                break
+        summaries[id(node)] = (length, lead, trail)
+        lengths[id(node)] = length - lead - trail if lead < length else 0
+    return lengths
+
+def build_post(page_name, post_text, post_url, timestamp):
+    """Post dict in the shape every scraper returns"""
+    return {
+        'title': f"{page_name}: {post_text[:50]}..." if len(post_text) > 50 else f"{page_name}: {post_text}",
+        'summary': post_text,
+        'source': f"Facebook/{page_name}",
+        'link': post_url,
+        'published': timestamp,
+        'author': page_name,
+        'category': PAGE_CATEGORY.get(page_name.lower())
+    }
+
+def bs4_post_link(container):
+    """href of the story or photo link in a BeautifulSoup post container, or None"""
+    post_link = STORY_LINK_SELECTOR.select_one(container)
+    if post_link is None:
+        post_link = PHOTO_LINK_SELECTOR.select_one(container)
+    return post_link['href'] if post_link is not None else None
+
+def selectolax_post_link(container):
+    """href of the story or photo link in a selectolax post container, or None"""
+    post_link = container.css_first('a[href*="/story.php"]')
+    if post_link is None:
+        post_link = container.css_first('a[href*="/photo.php"]')
+    return post_link.attributes['href'] if post_link is not None else None
+
+# Per-backend accessors for extract_mbasic_posts: (text of a node, paragraphs of a container,
+# post link href of a container, timestamp abbr of a container)
+BS4_ACCESSORS = (
+    lambda node: node.get_text(),
+    lambda container: PARAGRAPH_SELECTOR.select(container),
+    bs4_post_link,
+    lambda container: TIMESTAMP_SELECTOR.select_one(container),
+)
+SELECTOLAX_ACCESSORS = (
+    lambda node: node.text(),
+    lambda container: container.css('p'),
+    selectolax_post_link,
+    lambda container: container.css_first('abbr'),
+)
+
+def extract_mbasic_posts(article_containers, page_name, url, limit, accessors):
+    """Build posts from mbasic post containers parsed by either backend's accessors"""
+    text, paragraphs, post_link, abbr = accessors
+    posts = []
+    for container in article_containers[:limit]:
+        try:
+            # Extract post text from paragraph elements
+            post_text = ' '.join(part for part in (text(p).strip() for p in paragraphs(container)) if part)
+            
+            if not post_text:
+                # Try alternate approach to find text
+                all_text = text(container).strip()
+                if len(all_text) > 20:  # Only consider if it has substantial content
+                    post_text = all_text
+                else:
+                    continue
+            
+            # Extract post URL
+            href = post_link(container)
+            post_url = facebook_url(href) if href else f"{url}"
+            
+            # Extract timestamp
+            timestamp_elem = abbr(container)
+            timestamp = datetime.datetime.now().isoformat()
+            if timestamp_elem is not None:
+                timestamp = convert_facebook_timestamp(text(timestamp_elem).strip())
+            
+            posts.append(build_post(page_name, post_text, post_url, timestamp))
+            
+        except Exception as e:
+            logger.error(f"Error parsing mbasic Facebook post: {e}")
+            continue
+    
+    return posts
 
 def scrape_facebook_page(page_name, limit=10):
     """Scrape posts from a public Facebook page"""
@@ -201,26 +490,34 @@ def scrape_facebook_page(page_name, limit=10):
     url = f"https://www.facebook.com/{page_name}"
     logger.info(f"Scraping Facebook page: {url}")
     
+    # The remaining headers are set once on SESSION
     headers = {
         'User-Agent': get_random_user_agent(),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
         'Cache-Control': 'max-age=0',
     }
+    meta = load_page_meta(url)
+    headers.update(conditional_headers(meta))
     
     try:
-        # Try with verify=False to handle SSL certificate issues
-        response = requests.get(url, headers=headers, timeout=10, verify=False)
+        response, body = fetch_html(url, headers)
         
-        # Check if we're hitting a login wall or other blocking page
-        if 'You must log in to continue' in response.text or 'login' in response.url:
+        # An unchanged page needs no parsing
+        posts = cached_posts(url, response, meta)
+        if posts is not None:
+            return posts
+        
+        # Check if we're hitting a login wall or other blocking page; both are
+        # detected on the raw bytes so they are never parsed
+        if (b'You must log in to continue' in body or 'login' in response.url
+                or (len(body) < LOGIN_PAGE_MAX_BYTES and b'login' in body.lower())):
             logger.warning(f"Facebook login wall encountered for {page_name}, falling back to mbasic version")
             return scrape_mbasic_facebook(page_name, limit)
+        
+        if not is_html(response):
+            logger.warning(f"Non-HTML response ({response.headers.get('Content-Type')}) for {page_name}, falling back to mbasic version")
+            return scrape_mbasic_facebook(page_name, limit)
             
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(body, HTML_PARSER, from_encoding=response.encoding)
         posts = []
         
         # Facebook's dynamic loading makes it challenging to scrape directly
@@ -237,11 +534,9 @@ def scrape_facebook_page(page_name, limit=10):
             
         if not post_containers:
             # Look for any divs with substantial text that might be posts
-            candidates = []
-            for div in soup.select('div'):
-                text = div.get_text().strip()
-                if len(text) > 100 and len(text) < 2000:  # Reasonable post length
-                    candidates.append(div)
+            lengths = text_lengths(soup)
+            candidates = [div for div in soup.find_all('div')
+                          if 100 < lengths[id(div)] < 2000]  # Reasonable post length
             
             if candidates:
                 post_containers = candidates[:limit]
@@ -257,10 +552,10 @@ def scrape_facebook_page(page_name, limit=10):
         for container in post_containers[:limit]:
             try:
                 # Extract post text
-                post_text_elem = container.select_one('div[data-testid="post_message"]')
+                post_text_elem = POST_MESSAGE_SELECTOR.select_one(container)
                 if not post_text_elem:
                     # Try alternate selectors
-                    post_text_elem = container.select_one('div[dir="auto"]')
+                    post_text_elem = DIR_AUTO_SELECTOR.select_one(container)
                     
                 if not post_text_elem:
                     continue
@@ -268,36 +563,28 @@ def scrape_facebook_page(page_name, limit=10):
                 post_text = post_text_elem.get_text().strip()
                 
                 # Extract post URL
-                post_link = container.select_one('a[href*="/posts/"]')
+                post_link = POSTS_LINK_SELECTOR.select_one(container)
                 if not post_link:
-                    post_link = container.select_one('a[href*="/photos/"]')
+                    post_link = PHOTOS_LINK_SELECTOR.select_one(container)
                     
                 post_url = f"https://facebook.com{post_link['href']}" if post_link else f"{url}"
                 
                 # Extract timestamp (complex on Facebook due to their formatting)
-                timestamp_elem = container.select_one('abbr')
+                timestamp_elem = TIMESTAMP_SELECTOR.select_one(container)
                 timestamp = datetime.datetime.now().isoformat()
                 if timestamp_elem:
                     # Try to parse the timestamp text
                     timestamp_text = timestamp_elem.get_text().strip()
                     timestamp = convert_facebook_timestamp(timestamp_text)
                 
-                # Create post object
-                post = {
-                    'title': f"{page_name}: {post_text[:50]}..." if len(post_text) > 50 else f"{page_name}: {post_text}",
-                    'summary': post_text,
-                    'source': f"Facebook/{page_name}",
-                    'link': post_url,
-                    'published': timestamp,
-                    'author': page_name
-                }
-                
-                posts.append(post)
+                posts.append(build_post(page_name, post_text, post_url, timestamp))
                 
             except Exception as e:
                 logger.error(f"Error parsing Facebook post: {e}")
                 continue
         
+        if posts:
+            save_page_meta(url, response, posts)
         return posts
                 
     except RequestException as e:
@@ -314,57 +601,63 @@ def scrape_mbasic_facebook(page_name, limit=10):
     url = f"https://mbasic.facebook.com/{page_name}"
     logger.info(f"Scraping mbasic Facebook page: {url}")
     
-    headers = {
-        'User-Agent': get_random_user_agent(),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+    # The remaining headers are set once on SESSION
+    headers = {'User-Agent': get_random_user_agent()}
+    meta = load_page_meta(url)
+    headers.update(conditional_headers(meta))
     
     try:
-        # Try with verify=False to handle SSL certificate issues
-        response = requests.get(url, headers=headers, timeout=10, verify=False, allow_redirects=True)
+        response, body = fetch_html(url, headers, allow_redirects=True)
+        
+        # An unchanged page needs no parsing
+        posts = cached_posts(url, response, meta)
+        if posts is not None:
+            return posts
         
         # Check for app intent redirects which happen on mobile browsers
-        if 'intent://' in response.url or 'intent://' in response.text:
+        if 'intent://' in response.url or b'intent://' in body:
             logger.warning(f"Facebook redirected to mobile app intent for {page_name}, falling back to mock data")
             return generate_mock_facebook_posts(page_name, limit)
             
         # Check for login walls or redirects
-        if 'login' in response.url.lower() or 'You must log in' in response.text:
+        if 'login' in response.url.lower() or b'You must log in' in body:
             logger.warning(f"Login required on mbasic Facebook for {page_name}, falling back to mock data")
             return generate_mock_facebook_posts(page_name, limit)
+        
+        if not is_html(response):
+            logger.warning(f"Non-HTML response ({response.headers.get('Content-Type')}) on mbasic Facebook for {page_name}, falling back to mock data")
+            return generate_mock_facebook_posts(page_name, limit)
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        posts = []
+        # selectolax parses in C; BeautifulSoup is only needed when no container selector
+        # matches and the text-length scan below has to run
+        if SELECTOLAX_AVAILABLE:
+            posts = scrape_mbasic_with_selectolax(body, page_name, url, limit)
+            if posts is not None:
+                if not posts:
+                    logger.warning(f"No valid posts extracted from mbasic Facebook for {page_name}")
+                    return generate_mock_facebook_posts(page_name, limit)
+                save_page_meta(url, response, posts)
+                return posts
+            
+        soup = BeautifulSoup(body, HTML_PARSER, from_encoding=response.encoding)
         
         # mbasic Facebook has a simpler structure
-        article_containers = soup.select('article')
-        
-        if not article_containers:
-            # Try different selector
-            article_containers = soup.select('div[role="article"]')
-        
-        if not article_containers:
-            # Try common mbasic selectors
-            article_containers = soup.select('div.du, div.dv, div.cy, div.dw')
-            
-        if not article_containers:
-            # Try to find post content in story items
-            article_containers = soup.select('#m_story_permalink_view, .story_body_container')
+        article_containers = []
+        for selector in MBASIC_CONTAINER_SELECTORS:
+            article_containers = soup.select(selector)
+            if article_containers:
+                break
             
         if not article_containers:
             # Look for any substantial text sections as a last resort
+            lengths = text_lengths(soup)
             candidates = []
-            for section in soup.select('div'):
+            for section in soup.find_all('div'):
                 # Skip tiny divs and enormous divs
                 if section.get('class') and ('footer' in ' '.join(section.get('class')) or 'header' in ' '.join(section.get('class'))):
                     continue
                     
-                text = section.get_text().strip()
-                if len(text) > 100 and len(text) < 3000:
+                if 100 < lengths[id(section)] < 3000:
                     candidates.append(section)
                     
             if candidates:
@@ -377,62 +670,46 @@ def scrape_mbasic_facebook(page_name, limit=10):
         
         logger.info(f"Found {len(article_containers)} post containers on mbasic")
         
-        for container in article_containers[:limit]:
-            try:
-                # Extract post text from paragraph elements
-                paragraphs = container.select('p')
-                post_text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-                
-                if not post_text:
-                    # Try alternate approach to find text
-                    all_text = container.get_text().strip()
-                    if len(all_text) > 20:  # Only consider if it has substantial content
-                        post_text = all_text
-                    else:
-                        continue
-                
-                # Extract post URL
-                post_link = container.select_one('a[href*="/story.php"]')
-                if not post_link:
-                    post_link = container.select_one('a[href*="/photo.php"]')
-                
-                post_url = urljoin("https://facebook.com", post_link['href']) if post_link else f"{url}"
-                
-                # Extract timestamp 
-                timestamp_elem = container.select_one('abbr')
-                timestamp = datetime.datetime.now().isoformat()
-                if timestamp_elem:
-                    # Try to parse the timestamp text
-                    timestamp_text = timestamp_elem.get_text().strip()
-                    timestamp = convert_facebook_timestamp(timestamp_text)
-                
-                # Create post object
-                post = {
-                    'title': f"{page_name}: {post_text[:50]}..." if len(post_text) > 50 else f"{page_name}: {post_text}",
-                    'summary': post_text,
-                    'source': f"Facebook/{page_name}",
-                    'link': post_url,
-                    'published': timestamp,
-                    'author': page_name
-                }
-                
-                posts.append(post)
-                
-            except Exception as e:
-                logger.error(f"Error parsing mbasic Facebook post: {e}")
-                continue
+        posts = extract_mbasic_posts(article_containers, page_name, url, limit, BS4_ACCESSORS)
         
         # If we didn't find any valid posts, use mock data
         if not posts:
             logger.warning(f"No valid posts extracted from mbasic Facebook for {page_name}")
             return generate_mock_facebook_posts(page_name, limit)
             
+        save_page_meta(url, response, posts)
         return posts
                 
     except RequestException as e:
         logger.error(f"Error fetching mbasic Facebook page: {e}")
         return generate_mock_facebook_posts(page_name, limit)
 
+def scrape_mbasic_with_selectolax(body, page_name, url, limit=10):
+    """Extract posts from an mbasic page with selectolax; None if no container selector matches"""
+    tree = HTMLParser(body)
+    article_containers = []
+    for selector in MBASIC_CONTAINER_SELECTORS:
+        article_containers = tree.css(selector)
+        if article_containers:
+            break
+    if not article_containers:
+        return None
+    
+    logger.info(f"Found {len(article_containers)} post containers on mbasic")
+    return extract_mbasic_posts(article_containers, page_name, url, limit, SELECTOLAX_ACCESSORS)
+
+# Patterns for relative timestamps ("5 mins", "Yesterday at 14:30")
+_RE_NUMBER = re.compile(r'\d+')
+_RE_CLOCK = re.compile(r'(\d+):(\d+)')
+
+# Absolute date formats tried after the ISO fast path
+DATE_FORMATS = (
+    '%B %d, %Y',  # January 1, 2025
+    '%b %d, %Y',   # Jan 1, 2025
+    '%d %B %Y',    # 1 January 2025
+    '%Y-%m-%d',    # 2025-1-1 (unpadded, which fromisoformat rejects)
+)
+
 def convert_facebook_timestamp(timestamp_text):
     """Convert Facebook timestamp text to ISO format datetime"""
     now = datetime.datetime.now()
@@ -441,7 +718,7 @@ def convert_facebook_timestamp(timestamp_text):
     if 'min' in timestamp_text:
         # "X mins ago"
         try:
-            minutes = int(re.search(r'(\d+)', timestamp_text).group(1))
+            minutes = int(_RE_NUMBER.search(timestamp_text).group())
             dt = now - datetime.timedelta(minutes=minutes)
             return dt.isoformat()
         except Exception:
@@ -449,7 +726,7 @@ def convert_facebook_timestamp(timestamp_text):
     elif 'hr' in timestamp_text or 'hour' in timestamp_text:
         # "X hrs ago"
         try:
-            hours = int(re.search(r'(\d+)', timestamp_text).group(1))
+            hours = int(_RE_NUMBER.search(timestamp_text).group())
             dt = now - datetime.timedelta(hours=hours)
             return dt.isoformat()
         except Exception:
@@ -457,7 +734,7 @@ def convert_facebook_timestamp(timestamp_text):
     elif 'yesterday' in timestamp_text.lower():
         # "Yesterday at XX:XX"
         try:
-            time_part = re.search(r'(\d+):(\d+)', timestamp_text)
+            time_part = _RE_CLOCK.search(timestamp_text)
             if time_part:
                 hour, minute = map(int, time_part.groups())
                 dt = now - datetime.timedelta(days=1)
@@ -469,24 +746,70 @@ def convert_facebook_timestamp(timestamp_text):
         except Exception:
             pass
     
-    # Try to parse absolute dates in various formats
-    date_formats = [
-        '%B %d, %Y',  # January 1, 2025
-        '%b %d, %Y',   # Jan 1, 2025
-        '%d %B %Y',    # 1 January 2025
-        '%Y-%m-%d',    # 2025-01-01
-    ]
-    
-    for fmt in date_formats:
+    # Every absolute format has a day number; without a digit, skip straight to the fallback
+    if _RE_NUMBER.search(timestamp_text):
+        # ISO dates (2025-01-01) parse in C without strptime's format handling
         try:
-            dt = datetime.datetime.strptime(timestamp_text, fmt)
-            return dt.isoformat()
+            return datetime.datetime.fromisoformat(timestamp_text).isoformat()
         except ValueError:
-            continue
+            pass
+        
+        # Try to parse absolute dates in various formats
+        for fmt in DATE_FORMATS:
+            try:
+                dt = datetime.datetime.strptime(timestamp_text, fmt)
+                return dt.isoformat()
+            except ValueError:
+                continue
     
     # If all parsing fails, return current time
     return now.isoformat()
 
+# Mock post topics by page type: (page name fragments, topics), first match wins
+MOCK_PAGE_TOPICS = (
+    # News organizations
+    (('bbc', 'cnn', 'reuters', 'nytimes', 'guardian'), (
+        'Breaking news: Major political summit announced for next month focusing on international cooperation.',
+        'Latest economic indicators show better than expected growth in the manufacturing sector this quarter.',
+        'Scientists discover promising new approach to renewable energy with higher efficiency solar cells.',
+        'Cultural landmark celebrates its 100th anniversary with special public exhibitions and events.',
+        'New health study suggests link between lifestyle choices and longevity, surprising researchers.'
+    )),
+    # Tech publications
+    (('techcrunch', 'wired'), (
+        'Breaking: Tech giant announces revolutionary new AR platform for developers.',
+        'Startup secures $200 million funding to scale their AI-powered healthcare solution.',
+        'Review: We tested the latest smartphone and it is a game-changer for content creators.',
+        'Cybersecurity alert: New vulnerability discovered affecting millions of devices.',
+        'The future of work: How remote collaboration tools are transforming office culture.'
+    )),
+    # Sports outlets
+    (('espn', 'sport'), (
+        'Championship recap: Underdog team makes stunning comeback in final minutes.',
+        'Player profile: Rising star journey from small-town roots to international fame.',
+        'Breaking transfer news: Top player makes surprise move in record-breaking deal.',
+        'Injury update: Team star player expected to return just in time for playoffs.',
+        'Analysis: The tactical innovation that is changing how the game is played.'
+    )),
+)
+
+# Generic mock topics for any other page, formatted with the page name
+GENERIC_MOCK_TOPICS = (
+    "Latest update from {page_name} on recent developments in our field.",
+    "Exciting news to share with our {page_name} community about upcoming events.",
+    "Our team at {page_name} has been working on something special to announce soon.",
+    "A look back at what {page_name} has accomplished over the past year.",
+    "Thank you to our supporters who make all the work at {page_name} possible!"
+)
+
+def mock_topics(page_name):
+    """Pick the mock topics matching a page's type"""
+    page_name_lower = page_name.lower()
+    for fragments, topics in MOCK_PAGE_TOPICS:
+        if any(fragment in page_name_lower for fragment in fragments):
+            return topics
+    return tuple(topic.format(page_name=page_name) for topic in GENERIC_MOCK_TOPICS)
+
 def generate_mock_facebook_posts(page_name, limit=10):
     """Generate mock Facebook posts when scraping fails"""
     logger.info(f"Generating mock Facebook posts for {page_name}")
@@ -494,62 +817,12 @@ def generate_mock_facebook_posts(page_name, limit=10):
     mock_posts = []
     
     # Create mock content relevant to the page type
-    page_content = {}
-    
-    # Define custom content by page type
-    if any(name in page_name.lower() for name in ['bbc', 'cnn', 'reuters', 'nytimes', 'guardian']):
-        # News organizations
-        page_content = {
-            'category': 'General',
-            'topics': [
-                'Breaking news: Major political summit announced for next month focusing on international cooperation.',
-                'Latest economic indicators show better than expected growth in the manufacturing sector this quarter.',
-                'Scientists discover promising new approach to renewable energy with higher efficiency solar cells.',
-                'Cultural landmark celebrates its 100th anniversary with special public exhibitions and events.',
-                'New health study suggests link between lifestyle choices and longevity, surprising researchers.'
-            ]
-        }
-    elif any(name in page_name.lower() for name in ['techcrunch', 'wired']):
-        # Tech publications
-        page_content = {
-            'category': 'Tech',
-            'topics': [
-                'Breaking: Tech giant announces revolutionary new AR platform for developers.',
-                'Startup secures $200 million funding to scale their AI-powered healthcare solution.',
-                'Review: We tested the latest smartphone and it is a game-changer for content creators.',
-                'Cybersecurity alert: New vulnerability discovered affecting millions of devices.',
-                'The future of work: How remote collaboration tools are transforming office culture.'
-            ]
-        }
-    elif any(name in page_name.lower() for name in ['espn', 'sport']):
-        # Sports outlets
-        page_content = {
-            'category': 'Sports',
-            'topics': [
-                'Championship recap: Underdog team makes stunning comeback in final minutes.',
-                'Player profile: Rising star journey from small-town roots to international fame.',
-                'Breaking transfer news: Top player makes surprise move in record-breaking deal.',
-                'Injury update: Team star player expected to return just in time for playoffs.',
-                'Analysis: The tactical innovation that is changing how the game is played.'
-            ]
-        }
-    else:
-        # Generic content
-        page_content = {
-            'category': 'General',
-            'topics': [
-                f"Latest update from {page_name} on recent developments in our field.",
-                f"Exciting news to share with our {page_name} community about upcoming events.",
-                f"Our team at {page_name} has been working on something special to announce soon.",
-                f"A look back at what {page_name} has accomplished over the past year.",
-                f"Thank you to our supporters who make all the work at {page_name} possible!"
-            ]
-        }
+    topics = mock_topics(page_name)
     
     # Generate mock posts
-    for i in range(min(limit, len(page_content['topics']))):
+    for i in range(min(limit, len(topics))):
         # Use content appropriate to the page
-        content = page_content['topics'][i]
+        content = topics[i]
         
         # Create timestamp (progressively older)
         post_time = datetime.datetime.now() - datetime.timedelta(hours=i*4)
@@ -560,7 +833,8 @@ def generate_mock_facebook_posts(page_name, limit=10):
             'source': f"Facebook/{page_name}",
             'link': f"https://facebook.com/{page_name}/posts/mock{i}",
             'published': post_time.isoformat(),
-            'author': page_name
+            'author': page_name,
+            'category': PAGE_CATEGORY.get(page_name.lower())
         })
     
     return mock_posts
@@ -572,21 +846,16 @@ def clean_content(item):
         return None
     
     # Use provided category or determine from content
-    category = categorize_content(item.get('summary', ''), item.get('title', ''))
+    category = item.get('category') or categorize_content(item.get('summary', ''), item.get('title', ''))
     
-    # Generate a readable timestamp
-    if 'published' in item and item['published']:
-        try:
-            # If it's already a string, use it
-            if isinstance(item['published'], str):
-                timestamp = item['published']
-            # If it's a datetime, convert to ISO format
-            elif isinstance(item['published'], datetime.datetime):
-                timestamp = item['published'].isoformat()
-            else:
-                timestamp = str(item['published'])
-        except Exception:
-            timestamp = datetime.datetime.now().isoformat()
+    # Generate a readable timestamp; the scrapers already store ISO strings
+    published = item.get('published')
+    if isinstance(published, str) and published:
+        timestamp = published
+    elif isinstance(published, datetime.datetime):
+        timestamp = published.isoformat()
+    elif published:
+        timestamp = str(published)
     else:
         timestamp = datetime.datetime.now().isoformat()
     
@@ -613,17 +882,16 @@ def fetch_facebook_content():
     
     logger.info(f"Fetching content from {len(pages)} Facebook pages, limit {limit} per page")
     
-    all_content = []
-    
-    for page in pages:
+    def fetch_page(page):
+        """Scrape and clean one page; runs in a worker thread"""
+        page_content = []
         try:
             logger.info(f"Processing page: {page}")
             
-            # Wait between requests to avoid rate limiting
-            if pages.index(page) > 0:
-                sleep_time = random.uniform(2.0, 5.0)
-                logger.info(f"Waiting {sleep_time:.1f} seconds before next request")
-                time.sleep(sleep_time)
+            # Stagger requests with random jitter to avoid rate limiting
+            sleep_time = random.uniform(0.5, 2.0)
+            logger.info(f"Waiting {sleep_time:.1f} seconds before requesting {page}")
+            time.sleep(sleep_time)
             
             # Try to scrape the page
             posts = scrape_facebook_page(page, limit)
@@ -632,25 +900,36 @@ def fetch_facebook_content():
             for post in posts:
                 cleaned = clean_content(post)
                 if cleaned:
-                    all_content.append(cleaned)
+                    page_content.append(cleaned)
             
             logger.info(f"Processed {len(posts)} posts from {page}")
             
         except Exception as e:
             logger.error(f"Error processing page {page}: {e}")
+        return page_content
+    
+    # Fetching is network-bound, so pages are scraped in parallel threads;
+    # the worker count caps how many requests hit Facebook at once
+    all_content = []
+    max_workers = max(1, min(args.workers, len(pages)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the results in page order
+        for page_content in executor.map(fetch_page, pages):
+            all_content.extend(page_content)
     
     # Store content in MongoDB if available and not in dry run mode
     if MONGODB_AVAILABLE and not dry_run:
         stored_count = 0
-        for cleaned in all_content:
+        # Use upsert to avoid duplicates based on URL, sent in unordered bulk writes
+        # so one failing post doesn't stop the rest of its batch
+        ops = [UpdateOne({'url': cleaned['url']}, {'$set': cleaned}, upsert=True) for cleaned in all_content]
+        for start in range(0, len(ops), WRITE_BATCH_SIZE):
             try:
-                # Use upsert to avoid duplicates based on URL
-                content_collection.update_one(
-                    {'url': cleaned['url']}, 
-                    {'$set': cleaned}, 
-                    upsert=True
-                )
-                stored_count += 1
+                result = content_collection.bulk_write(ops[start:start + WRITE_BATCH_SIZE], ordered=False)
+                stored_count += result.upserted_count + result.matched_count
+            except BulkWriteError as e:
+                stored_count += e.details.get('nUpserted', 0) + e.details.get('nMatched', 0)
+                logger.error(f"Error storing content: {e.details.get('writeErrors', [])[:5]}")
             except Exception as e:
                 logger.error(f"Error storing content: {e}")
         
@@ -665,7 +944,7 @@ def fetch_facebook_content():
         if all_content:
             # Use a more robust JSON printing approach
             try:
-                sample_json = json.dumps(all_content[0], indent=2)
+                sample_json = json_dumps(all_content[0])
                 logger.info(f"Sample content item: {sample_json}")
             except Exception as e:
                 logger.error(f"Error printing sample: {e}")
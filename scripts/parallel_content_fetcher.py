@@ -22,7 +22,9 @@ Arguments:
 """
 
 import os
+import re
 import sys
+import html
 import json
 import time
 import datetime
@@ -172,6 +174,28 @@ def load_config(config_path: str = 'sources.json') -> Dict[str, Any]:
         # Return default empty config
         return {'rss': [], 'twitter': [], 'facebook': [], 'reddit': [], '4chan': [], 'youtube': []}
 
+# Matches any HTML tag; enough for feed summaries without script/style blocks
+_TAG_RE = re.compile(r'<[^>]+>')
+
+def strip_html(text: str) -> str:
+    """
+    Strip HTML markup from a feed summary.
+    
+    Uses a compiled regex plus html.unescape, falling back to BeautifulSoup
+    only when the snippet contains script or style blocks whose contents
+    would otherwise leak into the text.
+    
+    Args:
+        text: HTML snippet
+        
+    Returns:
+        Plain text
+    """
+    lowered = text.lower()
+    if BS4_AVAILABLE and ('<script' in lowered or '<style' in lowered):
+        return BeautifulSoup(text, 'html.parser').get_text()
+    return html.unescape(_TAG_RE.sub('', text))
+
 # Categorization function
 def categorize_content(text: str, title: str = "") -> str:
     """
@@ -387,10 +411,16 @@ def fetch_rss_feeds(feeds: List[Dict[str, Any]], limit: int = 50) -> List[Dict[s
             feed_items = []
             for entry in feed_data.entries[:limit]:
                 try:
-                    # Extract content
-                    content = entry.get('content', [{'value': ''}])[0].get('value', '')
+                    # Extract content along with the MIME type the feed declares for it
+                    content_detail = entry.get('content', [{'value': ''}])[0]
+                    content = content_detail.get('value', '')
                     if not content:
+                        content_detail = entry.get('summary_detail', {})
                         content = entry.get('summary', '')
+                    content_type = content_detail.get('type', 'text/html')
+                    # Plain-text content needs no HTML stripping
+                    if 'plain' not in content_type and ('<' in content or '&' in content):
+                        content = strip_html(content)
                     
                     # Create item
                     item = {
@@ -55,7 +55,7 @@ except Exception as e:
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    print(f"Warning: Could not set up file logging: {e}")
+    print(f"Warning: Could not set up file logging: {e}", file=sys.stderr)
     
 logger = logging.getLogger("reddit_scraper")
 